@@ -57,6 +57,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable
 
@@ -74,16 +75,24 @@ class FolderNavigatorError(ValueError):
     pass
 
 
+@lru_cache(maxsize=1)
+def _fixed_data_root() -> Path:
+    # resolve() walks every path component; the module location never changes within a process.
+    openclaw_root = Path(__file__).resolve().parents[3]
+    return openclaw_root / "data" / "datastore2"
+
+
 @dataclass(slots=True)
 class FolderNavigator:
     data_root: Path
     area_aliases: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_AREA_ALIASES))
+    _area_roots: Dict[str, Path] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _domain_roots: Dict[tuple[str, str], Path] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def from_fixed_point(cls) -> "FolderNavigator":
         """Build from this module's fixed location: workspace/Skills/CommonCode."""
-        openclaw_root = Path(__file__).resolve().parents[3]
-        return cls(data_root=openclaw_root / "data" / "datastore2")
+        return cls(data_root=_fixed_data_root())
 
     @staticmethod
     def parse_date(value: str | date | datetime) -> date:
@@ -125,11 +134,18 @@ class FolderNavigator:
         return path
 
     def get_area_root(self, area: str, create: bool = False) -> Path:
-        path = self.data_root / self.normalize_area(area)
+        path = self._area_roots.get(area)
+        if path is None:
+            path = self.data_root / self.normalize_area(area)
+            self._area_roots[area] = path
         return self.ensure(path) if create else path
 
     def get_domain_root(self, area: str, domain: str, create: bool = False) -> Path:
-        path = self.get_area_root(area, create=create) / self.validate_domain(domain)
+        key = (area, domain)
+        path = self._domain_roots.get(key)
+        if path is None:
+            path = self.get_area_root(area) / self.validate_domain(domain)
+            self._domain_roots[key] = path
         return self.ensure(path) if create else path
 
     def get_date_path(
@@ -140,7 +156,8 @@ class FolderNavigator:
         create: bool = False,
     ) -> Path:
         parsed = self.parse_date(value)
-        path = self.get_domain_root(area, domain, create=create) / f"{parsed.year:04d}" / f"{parsed.month:02d}" / f"{parsed.day:02d}"
+        # ensure() creates missing parents, so the domain root needs no separate mkdir.
+        path = self.get_domain_root(area, domain) / f"{parsed.year:04d}" / f"{parsed.month:02d}" / f"{parsed.day:02d}"
         return self.ensure(path) if create else path
 
     def get_today_path(self, area: str, domain: str, create: bool = False) -> Path:
@@ -152,24 +169,28 @@ class FolderNavigator:
             return []
         return sorted(p.name for p in area_path.iterdir() if p.is_dir())
 
+    @staticmethod
+    def _numeric_children_desc(path: Path, width: int) -> list[Path]:
+        children = (p for p in path.iterdir() if p.is_dir() and p.name.isdigit() and len(p.name) == width)
+        return sorted(children, key=lambda p: p.name, reverse=True)
+
     def latest_date_path(self, area: str, domain: str) -> Path | None:
         domain_root = self.get_domain_root(area, domain)
         if not domain_root.exists():
             return None
 
-        latest: tuple[date, Path] | None = None
-
-        for year in (p for p in domain_root.iterdir() if p.is_dir() and p.name.isdigit() and len(p.name) == 4):
-            for month in (p for p in year.iterdir() if p.is_dir() and p.name.isdigit() and len(p.name) == 2):
-                for day in (p for p in month.iterdir() if p.is_dir() and p.name.isdigit() and len(p.name) == 2):
+        # Zero-padded names sort chronologically, so the first valid day found
+        # walking newest-first is the latest one.
+        for year in self._numeric_children_desc(domain_root, 4):
+            for month in self._numeric_children_desc(year, 2):
+                for day in self._numeric_children_desc(month, 2):
                     try:
-                        dt_value = date(int(year.name), int(month.name), int(day.name))
+                        date(int(year.name), int(month.name), int(day.name))
                     except ValueError:
                         continue
-                    if latest is None or dt_value > latest[0]:
-                        latest = (dt_value, day)
+                    return day
 
-        return latest[1] if latest else None
+        return None
 
 
 __all__ = ["FolderNavigator", "FolderNavigatorError", "DEFAULT_AREA_ALIASES"]
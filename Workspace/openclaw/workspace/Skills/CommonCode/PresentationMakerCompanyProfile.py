@@ -5,27 +5,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import sys
 from pathlib import Path
 
-try:
-    from pptx import Presentation
-    from pptx.dml.color import RGBColor
-    from pptx.enum.shapes import MSO_SHAPE
-    from pptx.util import Inches, Pt
-except ImportError:
-    print(
-        json.dumps(
-            {
-                "error": "Missing dependency python-pptx. Install with: pip install python-pptx",
-                "status": "error",
-            },
-            ensure_ascii=False,
-        )
-    )
-    sys.exit(1)
-
 
 FIELD_TOKENS = {
     "FIELD_TITLE": "{{TITLE}}",
@@ -43,6 +27,16 @@ def _set_shape_name(shape, name: str) -> None:
 
 
 def create_company_profile_template(target_path: str | Path) -> Path:
+    # python-pptx is only needed to build the template, so it is imported here
+    # rather than at module load.
+    try:
+        from pptx import Presentation
+        from pptx.dml.color import RGBColor
+        from pptx.enum.shapes import MSO_SHAPE
+        from pptx.util import Inches, Pt
+    except ImportError as exc:
+        raise RuntimeError("Missing dependency python-pptx. Install with: pip install python-pptx") from exc
+
     out_path = Path(target_path).resolve()
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -124,14 +118,33 @@ def ensure_standard_template(force: bool = False) -> Path:
     return template_path
 
 
+def load_template_presentation():
+    # Parsing the template directly avoids copying it to the output folder and re-reading the copy.
+    try:
+        from pptx import Presentation
+    except ImportError as exc:
+        raise RuntimeError("Missing dependency python-pptx. Install with: pip install python-pptx") from exc
+
+    return Presentation(str(ensure_standard_template(force=False)))
+
+
 def instantiate_template(output_dir: str | Path, output_name: str = TEMPLATE_FILENAME, overwrite: bool = True) -> Path:
     template_path = ensure_standard_template(force=False)
     target_dir = Path(output_dir).resolve()
     target_dir.mkdir(parents=True, exist_ok=True)
     target_path = target_dir / (output_name or TEMPLATE_FILENAME)
-    if target_path.exists() and not overwrite:
-        raise FileExistsError(f"Target file already exists: {target_path}")
+    template_stat = template_path.stat()
+    if target_path.exists():
+        if not overwrite:
+            raise FileExistsError(f"Target file already exists: {target_path}")
+        target_stat = target_path.stat()
+        if (target_stat.st_size, target_stat.st_mtime_ns) == (template_stat.st_size, template_stat.st_mtime_ns):
+            return target_path
+
+    # copyfile uses the kernel's zero-copy path where available; stamping the
+    # template's times on the copy lets an untouched instance skip the next copy.
     shutil.copyfile(template_path, target_path)
+    os.utime(target_path, ns=(template_stat.st_atime_ns, template_stat.st_mtime_ns))
     return target_path
 
 
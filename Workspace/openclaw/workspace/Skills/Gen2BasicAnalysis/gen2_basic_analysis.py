@@ -2,16 +2,26 @@
 """Gen2BasicAnalysis - Domain/timeframe LLM analysis over mined logs."""
 
 import argparse
+import codecs
 import datetime as dt
+import io
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SKILLS_ROOT = Path(__file__).resolve().parent.parent
 if str(SKILLS_ROOT) not in sys.path:
@@ -19,6 +29,49 @@ if str(SKILLS_ROOT) not in sys.path:
 
 from CommonCode.FolderNavigator import FolderNavigator
 
+CORPUS_READ_WORKERS = 16
+
+DOMAIN_RE = re.compile(r"[A-Za-z]+")
+NAME_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def build_llm_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+LLM_SESSION = build_llm_session()
+
+
+def json_dumps_bytes(value, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE if pretty else None)
+    if pretty:
+        return (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass(frozen=True)
 class Timeframe:
@@ -40,11 +93,19 @@ def validate_domain(domain: str) -> str:
     if not domain or not isinstance(domain, str):
         raise ValueError("Domain must be a non-empty string")
     cleaned = domain.strip()
-    if not re.fullmatch(r"[A-Za-z]+", cleaned):
+    if not DOMAIN_RE.fullmatch(cleaned):
         raise ValueError("Domain must be alphabetic only (A-Z, a-z)")
     return cleaned
 
 
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    if not (1 <= year <= 9999 and 1 <= month <= 12):
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= DAYS_IN_MONTH[month]
+
+
 def parse_timeframe(value: str) -> Timeframe:
     cleaned = (value or "").strip().replace("-", "/")
     if not cleaned:
@@ -77,15 +138,16 @@ def parse_timeframe(value: str) -> Timeframe:
 
     try:
         day = int(parts[2])
-        dt.date(year, month, day)
     except ValueError as exc:
         raise ValueError("Invalid day for given year/month") from exc
+    if not is_valid_date(year, month, day):
+        raise ValueError("Invalid day for given year/month")
 
     return Timeframe(scope="day", year=year, month=month, day=day)
 
 
 def safe_name(text: str, fallback: str = "Analysis") -> str:
-    tokens = re.findall(r"[A-Za-z0-9]+", text or "")
+    tokens = NAME_TOKEN_RE.findall(text or "")
     if not tokens:
         return fallback
     parts = []
@@ -97,35 +159,33 @@ def safe_name(text: str, fallback: str = "Analysis") -> str:
     return "".join(parts)[:80]
 
 
-def extract_date_from_mine_path(path: Path, mine_domain_root: Path) -> dt.date | None:
-    try:
-        rel = path.relative_to(mine_domain_root)
-    except Exception:
-        return None
-
-    if len(rel.parts) < 4:
-        return None
-
-    year_part, month_part, day_part = rel.parts[0], rel.parts[1], rel.parts[2]
-    if not (year_part.isdigit() and len(year_part) == 4):
-        return None
-    if not (month_part.isdigit() and len(month_part) == 2):
-        return None
-    if not (day_part.isdigit() and len(day_part) == 2):
-        return None
-
+def _numeric_subdirs(path: str, width: int) -> List[tuple[int, str]]:
     try:
-        return dt.date(int(year_part), int(month_part), int(day_part))
-    except ValueError:
-        return None
-
-
-def date_matches_timeframe(value: dt.date, timeframe: Timeframe) -> bool:
-    if timeframe.scope == "year":
-        return value.year == timeframe.year
-    if timeframe.scope == "month":
-        return value.year == timeframe.year and value.month == timeframe.month
-    return value.year == timeframe.year and value.month == timeframe.month and value.day == timeframe.day
+        with os.scandir(path) as entries:
+            return [
+                (int(entry.name), entry.path)
+                for entry in entries
+                if len(entry.name) == width and entry.name.isdigit() and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def _txt_files_under(path: str) -> List[str]:
+    found = []
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".txt") and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return found
 
 
 def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe, max_files: int) -> List[tuple[dt.date, Path]]:
@@ -133,13 +193,25 @@ def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe,
     if not mine_domain_root.exists():
         raise FileNotFoundError(f"Mine domain folder not found: {mine_domain_root}")
 
+    # Only descend into the YYYY/MM/DD folders the timeframe can match.
+    year_path = os.path.join(mine_domain_root, f"{timeframe.year:04d}")
+    if timeframe.scope == "year":
+        months = _numeric_subdirs(year_path, 2)
+    else:
+        months = [(timeframe.month, os.path.join(year_path, f"{timeframe.month:02d}"))]
+
     matched = []
-    for path in sorted(mine_domain_root.glob("**/*.txt")):
-        date_value = extract_date_from_mine_path(path, mine_domain_root)
-        if not date_value:
-            continue
-        if date_matches_timeframe(date_value, timeframe):
-            matched.append((date_value, path))
+    for month, month_path in months:
+        if timeframe.scope == "day":
+            days = [(timeframe.day, os.path.join(month_path, f"{timeframe.day:02d}"))]
+        else:
+            days = _numeric_subdirs(month_path, 2)
+
+        for day, day_path in days:
+            if not is_valid_date(timeframe.year, month, day):
+                continue
+            date_value = dt.date(timeframe.year, month, day)
+            matched.extend((date_value, Path(file_path)) for file_path in _txt_files_under(day_path))
 
     matched.sort(key=lambda item: (item[0], str(item[1]).lower()))
     if max_files > 0:
@@ -147,33 +219,89 @@ def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe,
     return matched
 
 
-def build_corpus(files: List[tuple[dt.date, Path]], max_chars_per_file: int, max_total_chars: int):
-    blocks = []
-    total = 0
+def _clip_corpus_text(text: str, max_chars: int) -> str:
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    raw = text.strip()
+    if max_chars > 0 and len(raw) > max_chars:
+        raw = raw[:max_chars].rstrip() + "\n…"
+    return raw
 
-    for index, (date_value, path) in enumerate(files, start=1):
-        try:
-            raw = path.read_text(encoding="utf-8", errors="replace").strip()
-        except Exception:
-            continue
 
-        if max_chars_per_file > 0 and len(raw) > max_chars_per_file:
-            raw = raw[:max_chars_per_file].rstrip() + "\n…"
+def _read_corpus_file(path: Path, max_chars: int) -> str | None:
+    try:
+        with path.open("rb") as handle:
+            if max_chars <= 0:
+                return _clip_corpus_text(handle.read().decode("utf-8", errors="replace"), max_chars)
+
+            # A UTF-8 char is at most 4 bytes, so a full window holds more than max_chars chars.
+            limit = 4 * (max_chars + 1)
+            data = handle.read(limit)
+            if len(data) == limit:
+                # The incremental decoder holds back a char split by the window instead of replacing it.
+                head = codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data)
+                head = head.replace("\r\n", "\n").replace("\r", "\n").lstrip()
+                # Non-blank text past the cap means the whole file truncates at the same point.
+                if head[max_chars:].strip():
+                    return head[:max_chars].rstrip() + "\n…"
+                # Leading or trailing blanks filled the window; only the full text can decide.
+                data += handle.read()
+    except Exception:
+        return None
 
-        header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
-        block = f"{header}\n{raw}".strip()
+    return _clip_corpus_text(data.decode("utf-8", errors="replace"), max_chars)
 
-        next_total = total + len(block)
-        if max_total_chars > 0 and next_total > max_total_chars:
-            break
 
-        blocks.append({"date": date_value.isoformat(), "path": str(path), "text": block})
-        total = next_total
+def build_corpus(files: List[tuple[dt.date, Path]], max_chars_per_file: int, max_total_chars: int):
+    blocks = []
+    buffer = io.StringIO()
+    total = 0
 
-    return blocks
+    executor = ThreadPoolExecutor(max_workers=CORPUS_READ_WORKERS)
+    try:
+        contents = executor.map(lambda path: _read_corpus_file(path, max_chars_per_file), [path for _, path in files])
+        for index, ((date_value, path), raw) in enumerate(zip(files, contents), start=1):
+            if raw is None:
+                continue
+
+            header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
+            block = f"{header}\n{raw}".strip()
+
+            next_total = total + len(block)
+            if max_total_chars > 0 and next_total > max_total_chars:
+                break
+
+            if blocks:
+                buffer.write("\n\n")
+            buffer.write(block)
+            blocks.append({"date": date_value.isoformat(), "path": str(path)})
+            total = next_total
+    finally:
+        # Files queued behind the budget cut-off are never read.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return blocks, buffer.getvalue()
+
+
+def read_chat_completion(response) -> str:
+    content_type = response.headers.get("content-type", "").lower()
+    if "text/event-stream" not in content_type:
+        body = json_loads(response.content)
+        return body.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+    buffer = io.StringIO()
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = json_loads(data).get("choices") or [{}]
+        buffer.write((choices[0].get("delta") or {}).get("content") or "")
+    return buffer.getvalue()
 
 
-def call_llm_analysis(prompt_text: str, timeframe: Timeframe, domain: str, corpus_blocks, llm_timeout_seconds: int):
+def call_llm_analysis(prompt_text: str, timeframe: Timeframe, domain: str, corpus_text: str, llm_timeout_seconds: int):
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is required for LLM analysis")
@@ -182,8 +310,6 @@ def call_llm_analysis(prompt_text: str, timeframe: Timeframe, domain: str, corpu
     base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").strip().rstrip("/")
     endpoint = f"{base_url}/chat/completions"
 
-    corpus_text = "\n\n".join(item["text"] for item in corpus_blocks)
-
     system_prompt = (
         "You are a rigorous analyst. Analyze provided dataset excerpts and produce JSON only. "
         "No markdown fences. Use evidence from the corpus and avoid invented facts."
@@ -207,35 +333,37 @@ def call_llm_analysis(prompt_text: str, timeframe: Timeframe, domain: str, corpu
     payload = {
         "model": model,
         "temperature": 0.2,
+        "stream": True,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
     }
 
-    response = requests.post(
+    with LLM_SESSION.post(
         endpoint,
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
-        json=payload,
+        data=json_dumps_bytes(payload),
         timeout=max(30, llm_timeout_seconds),
-    )
-    response.raise_for_status()
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        content = read_chat_completion(response)
 
-    body = response.json()
-    content = body.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not content:
         raise RuntimeError("LLM returned empty response")
 
     cleaned = content.strip()
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```(?:json)?", "", cleaned).strip()
-        cleaned = re.sub(r"```$", "", cleaned).strip()
+        cleaned = cleaned[3:].removeprefix("json").strip()
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3].rstrip()
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = json_loads(cleaned)
     except json.JSONDecodeError as exc:
         raise RuntimeError("LLM response was not valid JSON") from exc
 
@@ -280,7 +408,7 @@ def write_output(navigator: FolderNavigator, domain: str, timeframe: Timeframe,
         "analysis": llm_result["analysis"],
     }
 
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    out_path.write_bytes(json_dumps_bytes(payload, pretty=True))
     return out_path
 
 
@@ -333,7 +461,7 @@ def main():
                 f"No input .txt files found for domain '{domain}' and timeframe '{timeframe.normalized}'"
             )
 
-        corpus_blocks = build_corpus(
+        corpus_blocks, corpus_text = build_corpus(
             files=files,
             max_chars_per_file=max(500, args.max_chars_per_file),
             max_total_chars=max(2000, args.max_total_chars),
@@ -345,7 +473,7 @@ def main():
             prompt_text=prompt_text,
             timeframe=timeframe,
             domain=domain,
-            corpus_blocks=corpus_blocks,
+            corpus_text=corpus_text,
             llm_timeout_seconds=args.llm_timeout,
         )
 
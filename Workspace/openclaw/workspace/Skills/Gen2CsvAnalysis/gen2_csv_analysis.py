@@ -2,17 +2,26 @@
 """Gen2CsvAnalysis - Domain/timeframe LLM analysis with CSV output."""
 
 import argparse
+import codecs
 import csv
 import datetime as dt
+import hashlib
+import io
 import json
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SKILLS_ROOT = Path(__file__).resolve().parent.parent
 if str(SKILLS_ROOT) not in sys.path:
@@ -20,6 +29,67 @@ if str(SKILLS_ROOT) not in sys.path:
 
 from CommonCode.FolderNavigator import FolderNavigator
 
+WALK_WORKERS = 8
+CORPUS_READ_WORKERS = 16
+
+DOMAIN_RE = re.compile(r"[A-Za-z]+")
+NAME_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+FENCE_HEAD_RE = re.compile(r"^```(?:json)?")
+FENCE_TAIL_RE = re.compile(r"```$")
+
+NEWLINE_TO_SPACE = str.maketrans({"\r": " ", "\n": " "})
+
+LLM_CACHE_ROOT = Path(__file__).resolve().parents[3] / "cache" / "Gen2CsvAnalysis"
+LLM_CACHE_TTL_DAYS = 7
+
+
+def build_llm_session():
+    # requests (with urllib3, ssl and idna) is only loaded once an LLM call is actually made.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+LLM_SESSION = None
+LLM_SESSION_LOCK = threading.Lock()
+
+
+def get_llm_session():
+    global LLM_SESSION
+    with LLM_SESSION_LOCK:
+        if LLM_SESSION is None:
+            LLM_SESSION = build_llm_session()
+        return LLM_SESSION
+
+
+def json_dumps_bytes(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass(frozen=True)
 class Timeframe:
@@ -41,7 +111,7 @@ def validate_domain(domain: str) -> str:
     if not domain or not isinstance(domain, str):
         raise ValueError("Domain must be a non-empty string")
     cleaned = domain.strip()
-    if not re.fullmatch(r"[A-Za-z]+", cleaned):
+    if not DOMAIN_RE.fullmatch(cleaned):
         raise ValueError("Domain must be alphabetic only (A-Z, a-z)")
     return cleaned
 
@@ -86,7 +156,7 @@ def parse_timeframe(value: str) -> Timeframe:
 
 
 def safe_name(text: str, fallback: str = "CsvAnalysis") -> str:
-    tokens = re.findall(r"[A-Za-z0-9]+", text or "")
+    tokens = NAME_TOKEN_RE.findall(text or "")
     if not tokens:
         return fallback
     parts = []
@@ -98,35 +168,33 @@ def safe_name(text: str, fallback: str = "CsvAnalysis") -> str:
     return "".join(parts)[:80]
 
 
-def extract_date_from_mine_path(path: Path, mine_domain_root: Path) -> dt.date | None:
+def _numeric_subdirs(path: str, width: int) -> List[tuple[int, str]]:
     try:
-        rel = path.relative_to(mine_domain_root)
-    except Exception:
-        return None
-
-    if len(rel.parts) < 4:
-        return None
-
-    year_part, month_part, day_part = rel.parts[0], rel.parts[1], rel.parts[2]
-    if not (year_part.isdigit() and len(year_part) == 4):
-        return None
-    if not (month_part.isdigit() and len(month_part) == 2):
-        return None
-    if not (day_part.isdigit() and len(day_part) == 2):
-        return None
-
-    try:
-        return dt.date(int(year_part), int(month_part), int(day_part))
-    except ValueError:
-        return None
-
-
-def date_matches_timeframe(value: dt.date, timeframe: Timeframe) -> bool:
-    if timeframe.scope == "year":
-        return value.year == timeframe.year
-    if timeframe.scope == "month":
-        return value.year == timeframe.year and value.month == timeframe.month
-    return value.year == timeframe.year and value.month == timeframe.month and value.day == timeframe.day
+        with os.scandir(path) as entries:
+            return [
+                (int(entry.name), entry.path)
+                for entry in entries
+                if len(entry.name) == width and entry.name.isdigit() and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def _txt_files_under(path: str) -> List[str]:
+    found = []
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".txt") and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return found
 
 
 def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe, max_files: int) -> List[tuple[dt.date, Path]]:
@@ -134,44 +202,104 @@ def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe,
     if not mine_domain_root.exists():
         raise FileNotFoundError(f"Mine domain folder not found: {mine_domain_root}")
 
-    matched = []
-    for path in sorted(mine_domain_root.glob("**/*.txt")):
-        date_value = extract_date_from_mine_path(path, mine_domain_root)
-        if not date_value:
-            continue
-        if date_matches_timeframe(date_value, timeframe):
-            matched.append((date_value, path))
+    # Only descend into the YYYY/MM/DD folders the timeframe can match.
+    year_path = os.path.join(mine_domain_root, f"{timeframe.year:04d}")
+    if timeframe.scope == "year":
+        months = _numeric_subdirs(year_path, 2)
+    else:
+        months = [(timeframe.month, os.path.join(year_path, f"{timeframe.month:02d}"))]
+
+    day_folders = []
+    for month, month_path in months:
+        if timeframe.scope == "day":
+            days = [(timeframe.day, os.path.join(month_path, f"{timeframe.day:02d}"))]
+        else:
+            days = _numeric_subdirs(month_path, 2)
+
+        for day, day_path in days:
+            try:
+                day_folders.append((dt.date(timeframe.year, month, day), day_path))
+            except ValueError:
+                continue
 
-    matched.sort(key=lambda item: (item[0], str(item[1]).lower()))
-    if max_files > 0:
-        matched = matched[:max_files]
+    if len(day_folders) > 1:
+        with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(day_folders))) as executor:
+            listings = list(executor.map(_txt_files_under, [day_path for _, day_path in day_folders]))
+    else:
+        listings = [_txt_files_under(day_path) for _, day_path in day_folders]
+
+    # Day folders are date buckets, so only each day's files need sorting.
+    matched = []
+    for (date_value, _), file_paths in sorted(zip(day_folders, listings), key=lambda item: item[0][0]):
+        file_paths.sort(key=lambda file_path: (file_path.lower(), file_path))
+        matched.extend((date_value, Path(file_path)) for file_path in file_paths)
+        if 0 < max_files <= len(matched):
+            return matched[:max_files]
     return matched
 
 
+def _clip_corpus_text(text: str, max_chars: int) -> str:
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    raw = text.strip()
+    if max_chars > 0 and len(raw) > max_chars:
+        raw = raw[:max_chars].rstrip() + "\n…"
+    return raw
+
+
+def _read_corpus_file(path: Path, max_chars: int) -> str | None:
+    try:
+        with path.open("rb") as handle:
+            if max_chars <= 0:
+                return _clip_corpus_text(handle.read().decode("utf-8", errors="replace"), max_chars)
+
+            # A UTF-8 char is at most 4 bytes, so a full window holds more than max_chars chars.
+            limit = 4 * (max_chars + 1)
+            data = handle.read(limit)
+            if len(data) == limit:
+                # The incremental decoder holds back a char split by the window instead of replacing it.
+                head = codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data)
+                head = head.replace("\r\n", "\n").replace("\r", "\n").lstrip()
+                # Non-blank text past the cap means the whole file truncates at the same point.
+                if head[max_chars:].strip():
+                    return head[:max_chars].rstrip() + "\n…"
+                # Leading or trailing blanks filled the window; only the full text can decide.
+                data += handle.read()
+    except Exception:
+        return None
+
+    return _clip_corpus_text(data.decode("utf-8", errors="replace"), max_chars)
+
+
 def build_corpus(files: List[tuple[dt.date, Path]], max_chars_per_file: int, max_total_chars: int):
     blocks = []
+    buffer = io.StringIO()
     total = 0
 
-    for index, (date_value, path) in enumerate(files, start=1):
-        try:
-            raw = path.read_text(encoding="utf-8", errors="replace").strip()
-        except Exception:
-            continue
-
-        if max_chars_per_file > 0 and len(raw) > max_chars_per_file:
-            raw = raw[:max_chars_per_file].rstrip() + "\n…"
+    executor = ThreadPoolExecutor(max_workers=CORPUS_READ_WORKERS)
+    try:
+        contents = executor.map(lambda path: _read_corpus_file(path, max_chars_per_file), [path for _, path in files])
+        for index, ((date_value, path), raw) in enumerate(zip(files, contents), start=1):
+            if raw is None:
+                continue
 
-        header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
-        block = f"{header}\n{raw}".strip()
+            header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
+            block = f"{header}\n{raw}".strip()
 
-        next_total = total + len(block)
-        if max_total_chars > 0 and next_total > max_total_chars:
-            break
+            next_total = total + len(block)
+            if max_total_chars > 0 and next_total > max_total_chars:
+                break
 
-        blocks.append({"date": date_value.isoformat(), "path": str(path), "text": block})
-        total = next_total
+            if blocks:
+                buffer.write("\n\n")
+            buffer.write(block)
+            blocks.append({"date": date_value.isoformat(), "path": str(path)})
+            total = next_total
+    finally:
+        # Files queued behind the budget cut-off are never read.
+        executor.shutdown(wait=True, cancel_futures=True)
 
-    return blocks
+    return blocks, buffer.getvalue()
 
 
 def sanitize_csv_cell(value) -> str:
@@ -179,8 +307,10 @@ def sanitize_csv_cell(value) -> str:
         return ""
     if isinstance(value, (dict, list)):
         return json.dumps(value, ensure_ascii=False)
-    text = str(value).replace("\r\n", " ").replace("\n", " ").replace("\r", " ").strip()
-    return text
+    text = str(value)
+    if "\r\n" in text:
+        text = text.replace("\r\n", " ")
+    return text.translate(NEWLINE_TO_SPACE).strip()
 
 
 def normalize_table_payload(payload: dict) -> tuple[list[str], list[list[str]]]:
@@ -195,20 +325,19 @@ def normalize_table_payload(payload: dict) -> tuple[list[str], list[list[str]]]:
     if not isinstance(rows_raw, list):
         raise RuntimeError("LLM JSON must include 'rows' array")
 
-    columns = [sanitize_csv_cell(col) for col in columns_raw if sanitize_csv_cell(col)]
+    sanitize = sanitize_csv_cell
+    columns = [name for name in map(sanitize, columns_raw) if name]
     if not columns:
         raise RuntimeError("LLM returned empty columns after normalization")
 
+    width = len(columns)
     normalized_rows: list[list[str]] = []
     for item in rows_raw:
         if isinstance(item, dict):
-            row_values = [sanitize_csv_cell(item.get(col, "")) for col in columns]
+            normalized_rows.append([sanitize(item.get(col, "")) for col in columns])
         elif isinstance(item, list):
-            row_values = [sanitize_csv_cell(item[i] if i < len(item) else "") for i in range(len(columns))]
-        else:
-            continue
-
-        normalized_rows.append(row_values)
+            count = len(item)
+            normalized_rows.append([sanitize(item[i]) if i < count else "" for i in range(width)])
 
     if not normalized_rows:
         raise RuntimeError("LLM returned no valid row entries")
@@ -216,17 +345,34 @@ def normalize_table_payload(payload: dict) -> tuple[list[str], list[list[str]]]:
     return columns, normalized_rows
 
 
-def call_llm_for_table(prompt_text: str, timeframe: Timeframe, domain: str, corpus_blocks, llm_timeout_seconds: int):
-    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is required for LLM analysis")
+def _llm_cache_path(endpoint: str, model: str, domain: str, timeframe: Timeframe, prompt_text: str, corpus_text: str) -> Path:
+    key = json.dumps([endpoint, model, domain, timeframe.normalized, prompt_text, corpus_text], ensure_ascii=False)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return LLM_CACHE_ROOT / f"{digest}.json"
 
-    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
-    base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").strip().rstrip("/")
-    endpoint = f"{base_url}/chat/completions"
 
-    corpus_text = "\n\n".join(item["text"] for item in corpus_blocks)
+def load_cached_llm_result(path: Path, ttl_seconds: float) -> dict | None:
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        cached = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not isinstance(cached.get("table"), dict):
+        return None
+    return cached
+
 
+def store_cached_llm_result(path: Path, result: dict):
+    try:
+        LLM_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(json_dumps_bytes(result))
+    except OSError:
+        pass
+
+
+def build_table_request_body(model: str, prompt_text: str, timeframe: Timeframe, domain: str, corpus_text: str) -> bytes:
+    # Only the encoded bytes outlive this call, so the prompt copy of the corpus is freed before the request.
     system_prompt = (
         "You are a rigorous analyst that outputs tabular results for CSV export. "
         "Return JSON only with a stable table schema. "
@@ -259,35 +405,63 @@ def call_llm_for_table(prompt_text: str, timeframe: Timeframe, domain: str, corp
         ],
     }
 
-    response = requests.post(
+    return json_dumps_bytes(payload)
+
+
+def call_llm_for_table(
+    prompt_text: str,
+    timeframe: Timeframe,
+    domain: str,
+    corpus_text: str,
+    llm_timeout_seconds: int,
+    cache_ttl_days: float = LLM_CACHE_TTL_DAYS,
+):
+    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
+    base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").strip().rstrip("/")
+    endpoint = f"{base_url}/chat/completions"
+
+    cache_path = None
+    if cache_ttl_days > 0:
+        cache_path = _llm_cache_path(endpoint, model, domain, timeframe, prompt_text, corpus_text)
+        cached = load_cached_llm_result(cache_path, cache_ttl_days * 86400)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is required for LLM analysis")
+
+    request_body = build_table_request_body(model, prompt_text, timeframe, domain, corpus_text)
+
+    response = get_llm_session().post(
         endpoint,
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
-        json=payload,
+        data=request_body,
         timeout=max(30, llm_timeout_seconds),
     )
     response.raise_for_status()
 
-    body = response.json()
+    body = json_loads(response.content)
     content = body.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not content:
         raise RuntimeError("LLM returned empty response")
 
     cleaned = content.strip()
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```(?:json)?", "", cleaned).strip()
-        cleaned = re.sub(r"```$", "", cleaned).strip()
+        cleaned = FENCE_HEAD_RE.sub("", cleaned).strip()
+        cleaned = FENCE_TAIL_RE.sub("", cleaned).strip()
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = json_loads(cleaned)
     except json.JSONDecodeError as exc:
         raise RuntimeError("LLM response was not valid JSON") from exc
 
     columns, rows = normalize_table_payload(parsed)
 
-    return {
+    result = {
         "model": model,
         "endpoint": endpoint,
         "table": {
@@ -296,6 +470,9 @@ def call_llm_for_table(prompt_text: str, timeframe: Timeframe, domain: str, corp
             "notes": sanitize_csv_cell(parsed.get("notes", "")),
         },
     }
+    if cache_path is not None:
+        store_cached_llm_result(cache_path, result)
+    return {**result, "cached": False}
 
 
 def timeframe_output_dir(navigator: FolderNavigator, domain: str, timeframe: Timeframe) -> Path:
@@ -310,6 +487,43 @@ def timeframe_output_dir(navigator: FolderNavigator, domain: str, timeframe: Tim
     return path
 
 
+def csv_output_path(navigator: FolderNavigator, domain: str, timeframe: Timeframe, prompt_text: str) -> Path:
+    out_dir = timeframe_output_dir(navigator, domain, timeframe)
+    prompt_name = safe_name(prompt_text, fallback="CsvAnalysis")
+    scope_token = timeframe.normalized.replace("/", "-")
+    return out_dir / f"{prompt_name}_{scope_token}.csv"
+
+
+def corpus_fingerprint(prompt_text: str, corpus_text: str) -> str:
+    key = json.dumps([prompt_text, corpus_text], ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def load_reusable_table(out_path: Path, fingerprint: str) -> dict | None:
+    try:
+        if out_path.with_suffix(".hash").read_text(encoding="utf-8").strip() != fingerprint:
+            return None
+        with out_path.open("r", encoding="utf-8", newline="") as handle:
+            records = list(csv.reader(handle))
+    except OSError:
+        return None
+    if not records:
+        return None
+    return {"columns": records[0], "rows": records[1:]}
+
+
+def store_output_fingerprint(out_path: Path, fingerprint: str | None):
+    # A CSV written without a fingerprint must not inherit the previous run's hash.
+    hash_path = out_path.with_suffix(".hash")
+    try:
+        if fingerprint is None:
+            hash_path.unlink(missing_ok=True)
+        else:
+            hash_path.write_text(fingerprint, encoding="utf-8")
+    except OSError:
+        pass
+
+
 def write_csv_output(
     navigator: FolderNavigator,
     domain: str,
@@ -317,122 +531,163 @@ def write_csv_output(
     prompt_text: str,
     table: dict,
 ) -> Path:
-    out_dir = timeframe_output_dir(navigator, domain, timeframe)
-    prompt_name = safe_name(prompt_text, fallback="CsvAnalysis")
-    scope_token = timeframe.normalized.replace("/", "-")
-    out_path = out_dir / f"{prompt_name}_{scope_token}.csv"
+    out_path = csv_output_path(navigator, domain, timeframe, prompt_text)
 
-    with out_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(table["columns"])
-        writer.writerows(table["rows"])
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(table["columns"])
+    writer.writerows(table["rows"])
+    out_path.write_text(buffer.getvalue(), encoding="utf-8", newline="")
 
     return out_path
 
 
-def main():
-    parser = argparse.ArgumentParser(description="LLM CSV analysis over mined domain logs across timeframe")
-    parser.add_argument("domain", help="Domain name (alphabetic only)")
-    parser.add_argument("--timeframe", required=True, help="YYYY or YYYY/MM or YYYY/MM/DD")
-    parser.add_argument("--prompt", required=True, help="LLM CSV analysis instruction")
-    parser.add_argument("--max-files", type=int, default=200)
-    parser.add_argument("--max-chars-per-file", type=int, default=6000)
-    parser.add_argument("--max-total-chars", type=int, default=180000)
-    parser.add_argument("--llm-timeout", type=int, default=90)
-
-    try:
-        args = parser.parse_args()
-    except SystemExit:
-        return 1
-
+def run_analysis(
+    domain: str,
+    timeframe: str,
+    prompt: str,
+    max_files: int = 200,
+    max_chars_per_file: int = 6000,
+    max_total_chars: int = 180000,
+    llm_timeout: int = 90,
+    cache_ttl_days: float = LLM_CACHE_TTL_DAYS,
+    reuse_if_unchanged: bool = False,
+    navigator: FolderNavigator | None = None,
+) -> dict:
     try:
-        domain = validate_domain(args.domain)
-        timeframe = parse_timeframe(args.timeframe)
-        prompt_text = (args.prompt or "").strip()
+        domain_name = validate_domain(domain)
+        parsed_timeframe = parse_timeframe(timeframe)
+        prompt_text = (prompt or "").strip()
         if not prompt_text:
             raise ValueError("Prompt must be non-empty")
     except Exception as exc:
-        print(
-            json.dumps(
-                {
-                    "domain": args.domain if hasattr(args, "domain") else "",
-                    "timeframe": args.timeframe if hasattr(args, "timeframe") else "",
-                    "error": str(exc),
-                    "status": "error",
-                },
-                ensure_ascii=False,
-            )
-        )
-        return 1
+        return {
+            "domain": domain or "",
+            "timeframe": timeframe or "",
+            "error": str(exc),
+            "status": "error",
+        }
 
-    navigator = FolderNavigator.from_fixed_point()
+    if navigator is None:
+        navigator = FolderNavigator.from_fixed_point()
 
     try:
         files = collect_files(
             navigator=navigator,
-            domain=domain,
-            timeframe=timeframe,
-            max_files=max(1, args.max_files),
+            domain=domain_name,
+            timeframe=parsed_timeframe,
+            max_files=max(1, max_files),
         )
         if not files:
             raise FileNotFoundError(
-                f"No input .txt files found for domain '{domain}' and timeframe '{timeframe.normalized}'"
+                f"No input .txt files found for domain '{domain_name}' and timeframe '{parsed_timeframe.normalized}'"
             )
 
-        corpus_blocks = build_corpus(
+        corpus_blocks, corpus_text = build_corpus(
             files=files,
-            max_chars_per_file=max(500, args.max_chars_per_file),
-            max_total_chars=max(2000, args.max_total_chars),
+            max_chars_per_file=max(500, max_chars_per_file),
+            max_total_chars=max(2000, max_total_chars),
         )
         if not corpus_blocks:
             raise RuntimeError("No readable corpus content after bounds were applied")
 
-        llm_result = call_llm_for_table(
-            prompt_text=prompt_text,
-            timeframe=timeframe,
-            domain=domain,
-            corpus_blocks=corpus_blocks,
-            llm_timeout_seconds=args.llm_timeout,
-        )
-
-        out_path = write_csv_output(
-            navigator=navigator,
-            domain=domain,
-            timeframe=timeframe,
-            prompt_text=prompt_text,
-            table=llm_result["table"],
-        )
-
-        print(
-            json.dumps(
-                {
-                    "domain": domain,
-                    "timeframe": timeframe.normalized,
-                    "files_analyzed": len(corpus_blocks),
-                    "output_path": str(out_path),
-                    "columns": llm_result["table"]["columns"],
-                    "rows": len(llm_result["table"]["rows"]),
-                    "status": "ok",
-                },
-                ensure_ascii=False,
+        table = None
+        fingerprint = None
+        if reuse_if_unchanged:
+            # The previous CSV for this prompt still stands when its corpus has not changed.
+            fingerprint = corpus_fingerprint(prompt_text, corpus_text)
+            out_path = csv_output_path(navigator, domain_name, parsed_timeframe, prompt_text)
+            table = load_reusable_table(out_path, fingerprint)
+
+        cached = table is not None
+        if table is None:
+            llm_result = call_llm_for_table(
+                prompt_text=prompt_text,
+                timeframe=parsed_timeframe,
+                domain=domain_name,
+                corpus_text=corpus_text,
+                llm_timeout_seconds=llm_timeout,
+                cache_ttl_days=cache_ttl_days,
             )
-        )
-        return 0
+            table = llm_result["table"]
+            cached = llm_result["cached"]
+
+            out_path = write_csv_output(
+                navigator=navigator,
+                domain=domain_name,
+                timeframe=parsed_timeframe,
+                prompt_text=prompt_text,
+                table=table,
+            )
+            store_output_fingerprint(out_path, fingerprint)
+
+        return {
+            "domain": domain_name,
+            "timeframe": parsed_timeframe.normalized,
+            "files_analyzed": len(corpus_blocks),
+            "output_path": str(out_path),
+            "columns": table["columns"],
+            "rows": len(table["rows"]),
+            "cached": cached,
+            "status": "ok",
+        }
 
     except Exception as exc:
-        print(
-            json.dumps(
-                {
-                    "domain": domain,
-                    "timeframe": timeframe.normalized,
-                    "error": str(exc),
-                    "status": "error",
-                },
-                ensure_ascii=False,
-            )
-        )
+        return {
+            "domain": domain_name,
+            "timeframe": parsed_timeframe.normalized,
+            "error": str(exc),
+            "status": "error",
+        }
+
+
+def run_many(jobs: List[dict], max_parallel: int = 4, navigator: FolderNavigator | None = None) -> List[dict]:
+    # Each job holds run_analysis keyword arguments; results keep job order.
+    if not jobs:
+        return []
+
+    if navigator is None:
+        navigator = FolderNavigator.from_fixed_point()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(jobs)))) as executor:
+        return list(executor.map(lambda job: run_analysis(navigator=navigator, **job), jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM CSV analysis over mined domain logs across timeframe")
+    parser.add_argument("domain", help="Domain name (alphabetic only)")
+    parser.add_argument("--timeframe", required=True, help="YYYY or YYYY/MM or YYYY/MM/DD")
+    parser.add_argument("--prompt", required=True, help="LLM CSV analysis instruction")
+    parser.add_argument("--max-files", type=int, default=200)
+    parser.add_argument("--max-chars-per-file", type=int, default=6000)
+    parser.add_argument("--max-total-chars", type=int, default=180000)
+    parser.add_argument("--llm-timeout", type=int, default=90)
+    parser.add_argument("--cache-ttl-days", type=float, default=LLM_CACHE_TTL_DAYS, help="Reuse identical LLM results for this many days")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM and do not store the result")
+    parser.add_argument(
+        "--reuse-if-unchanged",
+        action="store_true",
+        help="Keep the existing CSV when prompt and corpus match the run that wrote it",
+    )
+
+    try:
+        args = parser.parse_args()
+    except SystemExit:
         return 1
 
+    result = run_analysis(
+        domain=args.domain,
+        timeframe=args.timeframe,
+        prompt=args.prompt,
+        max_files=args.max_files,
+        max_chars_per_file=args.max_chars_per_file,
+        max_total_chars=args.max_total_chars,
+        llm_timeout=args.llm_timeout,
+        cache_ttl_days=0 if args.no_cache else args.cache_ttl_days,
+        reuse_if_unchanged=args.reuse_if_unchanged,
+    )
+    print(json.dumps(result, ensure_ascii=False))
+    return 0 if result["status"] == "ok" else 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
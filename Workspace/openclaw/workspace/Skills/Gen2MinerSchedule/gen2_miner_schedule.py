@@ -3,13 +3,26 @@
 
 import argparse
 import datetime as dt
+import importlib
 import json
 import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def validate_domain(domain: str) -> str:
     value = (domain or "").strip()
@@ -33,7 +46,7 @@ def parse_date(value: str | None) -> dt.date:
 def load_config(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Config not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json_loads(path.read_bytes())
     if not isinstance(data, dict):
         raise ValueError("Config root must be a JSON object")
     tasks = data.get("tasks")
@@ -64,26 +77,85 @@ def task_is_due(task: dict, run_date: dt.date, cadence_filter: str) -> tuple[boo
     return True, "due"
 
 
-def parse_json_from_output(text: str) -> dict:
-    content = (text or "").strip()
-    if not content:
+def parse_json_from_output(output: bytes) -> dict:
+    raw = (output or b"").strip()
+    if not raw:
         return {}
 
-    lines = [line.strip() for line in content.splitlines() if line.strip()]
-    for line in reversed(lines):
-        if line.startswith("{") and line.endswith("}"):
+    try:
+        return json_loads(raw)
+    except json.JSONDecodeError:
+        pass
+
+    # Skills print their JSON summary last, so walk lines backwards from the end.
+    end = len(raw)
+    while end > 0:
+        start = raw.rfind(b"\n", 0, end) + 1
+        line = raw[start:end].strip()
+        if line.startswith(b"{") and line.endswith(b"}"):
             try:
-                return json.loads(line)
+                return json_loads(line)
             except json.JSONDecodeError:
-                continue
+                pass
+        end = start - 1
 
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        return {"raw": content}
+    return {"raw": raw.decode("utf-8", errors="replace")}
+
+
+def import_skill_module(skills_root: Path, module_name: str):
+    if str(skills_root) not in sys.path:
+        sys.path.insert(0, str(skills_root))
+    return importlib.import_module(module_name)
+
+
+def load_csv_analysis(skills_root: Path):
+    return import_skill_module(skills_root, "Gen2CsvAnalysis.gen2_csv_analysis")
+
+
+def build_navigator(skills_root: Path):
+    return import_skill_module(skills_root, "CommonCode.FolderNavigator").FolderNavigator.from_fixed_point()
+
+
+def run_csv_analysis_task(task: dict, task_name: str, domain: str, skills_root: Path, dry_run: bool, navigator=None) -> dict:
+    timeframe = str(task.get("timeframe", "")).strip()
+    prompt = str(task.get("prompt", "")).strip()
+    if not timeframe:
+        raise ValueError(f"Task '{task_name}' missing 'timeframe'")
+    if not prompt:
+        raise ValueError(f"Task '{task_name}' missing 'prompt'")
+
+    job = {"domain": domain, "timeframe": timeframe, "prompt": prompt}
+    for key in ("max_files", "max_chars_per_file", "max_total_chars", "llm_timeout"):
+        if key in task:
+            job[key] = int(task[key])
+    if "reuse_if_unchanged" in task:
+        job["reuse_if_unchanged"] = bool(task["reuse_if_unchanged"])
+
+    if dry_run:
+        return {
+            "name": task_name,
+            "type": "csvanalysis",
+            "domain": domain,
+            "job": job,
+            "status": "dry_run",
+        }
+
+    # Runs in-process so concurrent analyses share one interpreter and LLM connection pool.
+    result = load_csv_analysis(skills_root).run_analysis(navigator=navigator, **job)
+    succeeded = result.get("status") == "ok"
+    return {
+        "name": task_name,
+        "type": "csvanalysis",
+        "domain": domain,
+        "job": job,
+        "exit_code": 0 if succeeded else 1,
+        "status": "ok" if succeeded else "error",
+        "result": result,
+        "stderr": "",
+    }
 
 
-def run_task(task: dict, default_domain: str, skills_root: Path, python_exe: str, dry_run: bool) -> dict:
+def run_task(task: dict, default_domain: str, skills_root: Path, python_exe: str, dry_run: bool, navigator=None) -> dict:
     task_name = str(task.get("name", "Unnamed Task")).strip() or "Unnamed Task"
     task_type = str(task.get("type", "")).strip().lower()
     domain = validate_domain(task.get("domain") or default_domain)
@@ -139,6 +211,16 @@ def run_task(task: dict, default_domain: str, skills_root: Path, python_exe: str
             str(timeout_ms),
         ]
 
+    elif task_type == "csvanalysis":
+        return run_csv_analysis_task(
+            task,
+            task_name=task_name,
+            domain=domain,
+            skills_root=skills_root,
+            dry_run=dry_run,
+            navigator=navigator,
+        )
+
     else:
         raise ValueError(f"Task '{task_name}' has unsupported type '{task_type}'")
 
@@ -151,10 +233,9 @@ def run_task(task: dict, default_domain: str, skills_root: Path, python_exe: str
             "status": "dry_run",
         }
 
-    process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    stdout = (process.stdout or "").strip()
-    stderr = (process.stderr or "").strip()
-    parsed = parse_json_from_output(stdout)
+    process = subprocess.run(cmd, capture_output=True, check=False)
+    stderr = (process.stderr or b"").decode("utf-8", errors="replace").strip()
+    parsed = parse_json_from_output(process.stdout)
 
     status = "ok" if process.returncode == 0 else "error"
     return {
@@ -169,7 +250,14 @@ def run_task(task: dict, default_domain: str, skills_root: Path, python_exe: str
     }
 
 
-def run_single_config(config_path: Path, args, run_ts: str, skills_root: Path, python_exe: str) -> tuple[dict, int]:
+def run_single_config(
+    config_path: Path,
+    args,
+    run_ts: str,
+    skills_root: Path,
+    python_exe: str,
+    navigator=None,
+) -> tuple[dict, int]:
     try:
         run_date = parse_date(args.date)
         config = load_config(config_path)
@@ -207,6 +295,7 @@ def run_single_config(config_path: Path, args, run_ts: str, skills_root: Path, p
         "results": [],
     }
 
+    planned = []
     for task in config.get("tasks", []):
         if not isinstance(task, dict):
             summary["tasks_skipped"] += 1
@@ -227,7 +316,7 @@ def run_single_config(config_path: Path, args, run_ts: str, skills_root: Path, p
 
         summary["tasks_due"] += 1
 
-        if args.max_tasks > 0 and summary["tasks_executed"] >= args.max_tasks:
+        if args.max_tasks > 0 and len(planned) >= args.max_tasks:
             summary["tasks_skipped"] += 1
             summary["results"].append(
                 {
@@ -238,28 +327,35 @@ def run_single_config(config_path: Path, args, run_ts: str, skills_root: Path, p
             )
             continue
 
+        planned.append((len(summary["results"]), task))
+        summary["results"].append(None)
+
+    def execute_task(task: dict) -> dict:
         try:
-            result = run_task(
+            return run_task(
                 task=task,
                 default_domain=default_domain,
                 skills_root=skills_root,
                 python_exe=python_exe,
                 dry_run=args.dry_run,
+                navigator=navigator,
             )
-            summary["results"].append(result)
-            summary["tasks_executed"] += 1
-            if result.get("status") == "error":
-                summary["tasks_failed"] += 1
         except Exception as exc:
-            summary["tasks_executed"] += 1
-            summary["tasks_failed"] += 1
-            summary["results"].append(
-                {
-                    "name": str(task.get("name", "Unnamed Task")),
-                    "status": "error",
-                    "error": str(exc),
-                }
-            )
+            return {
+                "name": str(task.get("name", "Unnamed Task")),
+                "status": "error",
+                "error": str(exc),
+            }
+
+    if planned:
+        max_workers = max(1, min(args.max_parallel, len(planned)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(execute_task, [task for _, task in planned])
+            for (slot, _), result in zip(planned, outcomes):
+                summary["results"][slot] = result
+                summary["tasks_executed"] += 1
+                if result.get("status") == "error":
+                    summary["tasks_failed"] += 1
 
     if summary["tasks_failed"] > 0:
         summary["status"] = "partial_error"
@@ -270,16 +366,17 @@ def run_single_config(config_path: Path, args, run_ts: str, skills_root: Path, p
 
 def discover_config_files(base_config_path: Path) -> list[Path]:
     config_dir = base_config_path.parent
-    all_candidates = sorted(config_dir.glob("gen2_miner_schedule*_config.json"))
     excluded = {
         "gen2_miner_schedule_config.json",
         "gen2_miner_schedule_defence_companies_config.json",
     }
-    selected = [path.resolve() for path in all_candidates if path.name not in excluded]
-    if base_config_path.resolve() not in selected:
-        selected.append(base_config_path.resolve())
-        selected.sort()
-    return selected
+    selected = {
+        path.resolve()
+        for path in config_dir.glob("gen2_miner_schedule*_config.json")
+        if path.name not in excluded
+    }
+    selected.add(base_config_path.resolve())
+    return sorted(selected)
 
 
 def main() -> int:
@@ -289,6 +386,7 @@ def main() -> int:
     parser.add_argument("--date", default="", help="Run date in YYYY-MM-DD (default today)")
     parser.add_argument("--dry-run", action="store_true", help="Plan tasks without executing")
     parser.add_argument("--max-tasks", type=int, default=0, help="Optional execution cap")
+    parser.add_argument("--max-parallel", type=int, default=4, help="Max tasks executed concurrently per config")
     parser.add_argument(
         "--all-configs",
         action="store_true",
@@ -312,9 +410,15 @@ def main() -> int:
         print(json.dumps({"status": "error", "error": "--inter-config-delay must be >= 0"}, ensure_ascii=True))
         return 1
 
+    if args.max_parallel < 1:
+        print(json.dumps({"status": "error", "error": "--max-parallel must be >= 1"}, ensure_ascii=True))
+        return 1
+
     this_script = Path(__file__).resolve()
     skills_root = this_script.parent.parent
     python_exe = sys.executable
+    # One navigator serves every in-process task across all configs in this run.
+    navigator = build_navigator(skills_root)
 
     try:
         base_config_path = Path(args.config).resolve()
@@ -323,7 +427,7 @@ def main() -> int:
         return 1
 
     if not args.all_configs:
-        summary, exit_code = run_single_config(base_config_path, args, run_ts, skills_root, python_exe)
+        summary, exit_code = run_single_config(base_config_path, args, run_ts, skills_root, python_exe, navigator)
         print(json.dumps(summary, ensure_ascii=True))
         return exit_code
 
@@ -346,7 +450,7 @@ def main() -> int:
     }
 
     for index, config_path in enumerate(config_paths):
-        summary, exit_code = run_single_config(config_path, args, run_ts, skills_root, python_exe)
+        summary, exit_code = run_single_config(config_path, args, run_ts, skills_root, python_exe, navigator)
         aggregate["config_runs"].append(summary)
         aggregate["configs_executed"] += 1
         aggregate["tasks_total"] += int(summary.get("tasks_total", 0))
@@ -3,42 +3,191 @@
 
 import argparse
 import datetime as dt
+import hashlib
+import heapq
 import json
 import os
 import re
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 SKILLS_ROOT = Path(__file__).resolve().parent.parent
 if str(SKILLS_ROOT) not in sys.path:
     sys.path.insert(0, str(SKILLS_ROOT))
 
 from CommonCode.FolderNavigator import FolderNavigator
-from CommonCode.PresentationMakerCompanyProfile import instantiate_template
-
-try:
-    import requests
-    from pptx import Presentation
-except ImportError:
-    print(
-        json.dumps(
-            {
-                "domain": "",
-                "date": "",
-                "error": "Missing dependencies. Install with: pip install -r requirements.txt",
-                "status": "error",
-            },
-            ensure_ascii=False,
-        )
+from CommonCode.PresentationMakerCompanyProfile import load_template_presentation
+
+FILES_PER_CALL = 6
+
+DOMAIN_RE = re.compile(r"[A-Za-z]+")
+NAME_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+FENCE_HEAD_RE = re.compile(r"^```(?:json)?")
+FENCE_TAIL_RE = re.compile(r"```$")
+
+ANALYSIS_FIELDS = frozenset(
+    ("executive_summary", "key_trends", "delta_start_to_end", "supporting_evidence", "caveats", "confidence")
+)
+STREAM_THRESHOLD_BYTES = 256 * 1024
+MAX_SLIDE_POINTS = 10
+MAX_POINT_CHARS = 130
+FALLBACK_MAIN_TEXT = (
+    "• No clear major events extracted from available analysis.\n"
+    "• Review source analysis files and rerun with expanded date coverage."
+)
+ANALYSIS_READ_WORKERS = 8
+MAX_ANALYSIS_TOKENS = 6000
+CHARS_PER_TOKEN_ESTIMATE = 4
+BLOCK_LABELS = ("### Source: ", "Summary: ", "Trends: ", "Delta: ", "Evidence: ", "Caveats: ", "Confidence: ")
+BLOCK_LABEL_CHARS = sum(map(len, BLOCK_LABELS[:-1])) + len(BLOCK_LABELS) - 1
+
+LLM_CACHE_ROOT = Path(__file__).resolve().parents[3] / "cache" / "Gen2PresentationCompanyProfile"
+LLM_CACHE_TTL_SECONDS = 7 * 86400
+
+SYSTEM_PREAMBLE = (
+    "You are a presentation editor. Convert analysis into concise executive slide content. "
+    "Return strict JSON only with no markdown fences and no extra keys.\n\n"
+)
+SCHEMA_MARSHAL = (
+    "Return strict JSON with keys:\n"
+    "- slide_title (string)\n"
+    "- sources (array with one object per <<SOURCE n>> section, in order, each "
+    '{"index": n, "points": array of 1 to 3 strings, concise and factual})\n'
+    "- source_note (string)\n\n"
+)
+SCHEMA_POINTS = (
+    "Return strict JSON with keys:\n"
+    "- slide_title (string)\n"
+    "- main_points (array of 4 to 10 strings, concise and factual)\n"
+    "- source_note (string)\n\n"
+)
+SLIDE_RULES = (
+    "Rules:\n"
+    "- Prioritize money-linked events when available.\n"
+    "- Do not invent numbers; if uncertain, use wording like 'reported'.\n"
+    "- Keep each point under 120 characters when possible.\n"
+    "- The user message gives the domain, the date, an instruction and the analysis context; "
+    "use only facts present in the analysis context.\n"
+    "- slide_title names the company or domain and stays under 60 characters.\n"
+    "- source_note briefly states that the content was derived from dated analysis files.\n"
+)
+SYSTEM_PROMPT_MARSHAL = SYSTEM_PREAMBLE + SCHEMA_MARSHAL + SLIDE_RULES
+SYSTEM_PROMPT_POINTS = SYSTEM_PREAMBLE + SCHEMA_POINTS + SLIDE_RULES
+
+
+def build_llm_session():
+    # One pooled session so concurrent group calls and retries reuse TLS connections.
+    # requests is only loaded once an LLM call is actually made.
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError as exc:
+        raise RuntimeError("Missing dependency requests. Install with: pip install -r requirements.txt") from exc
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
     )
-    sys.exit(1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+LLM_SESSION = None
+LLM_SESSION_LOCK = threading.Lock()
+
+
+def get_llm_session():
+    global LLM_SESSION
+    with LLM_SESSION_LOCK:
+        if LLM_SESSION is None:
+            LLM_SESSION = build_llm_session()
+        return LLM_SESSION
+
+
+def json_dumps_bytes(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_dumps_pretty_bytes(value) -> bytes:
+    # default=str lets Path values serialize directly.
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, ensure_ascii=False, indent=2, default=str) + "\n").encode("utf-8")
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def stream_analysis_fields(path: Path):
+    # Only the summary fields are used, so skip building the large evidence subtrees.
+    fields = {}
+    with path.open("rb") as handle:
+        for key, value in ijson.kvitems(handle, "analysis", use_float=True):
+            if key in ANALYSIS_FIELDS:
+                fields[key] = value
+                if len(fields) == len(ANALYSIS_FIELDS):
+                    break
+    return fields
+
+
+def load_analysis_payload(path: Path):
+    if ijson is not None and path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        try:
+            fields = stream_analysis_fields(path)
+        except Exception:
+            fields = None
+        if fields:
+            return {"analysis": fields}
+
+    data = path.read_bytes()
+    try:
+        return json_loads(data)
+    except ValueError:
+        # Invalid UTF-8 used to be tolerated via errors="replace"; keep that on the slow path.
+        return json.loads(data.decode("utf-8", errors="replace"))
+
+
+def iso_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def validate_domain(domain: str) -> str:
     if not domain or not isinstance(domain, str):
         raise ValueError("Domain must be a non-empty string")
     cleaned = domain.strip()
-    if not re.fullmatch(r"[A-Za-z]+", cleaned):
+    if not DOMAIN_RE.fullmatch(cleaned):
         raise ValueError("Domain must be alphabetic only (A-Z, a-z)")
     return cleaned
 
@@ -56,7 +205,7 @@ def parse_date(value: str) -> dt.date:
 
 
 def safe_name(text: str, fallback: str = "CompanyProfile") -> str:
-    tokens = re.findall(r"[A-Za-z0-9]+", text or "")
+    tokens = NAME_TOKEN_RE.findall(text or "")
     if not tokens:
         return fallback
     parts = []
@@ -68,20 +217,30 @@ def safe_name(text: str, fallback: str = "CompanyProfile") -> str:
     return "".join(parts)[:80]
 
 
-def find_analysis_files(navigator: FolderNavigator, domain: str, as_of_date: dt.date):
+def _first_json_files(folder: Path, max_files: int | None) -> list[Path]:
+    try:
+        with os.scandir(folder) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    # Only the first max_files names are read, so a partial sort is enough.
+    names = sorted(names) if max_files is None else heapq.nsmallest(max_files, names)
+    return [folder / name for name in names]
+
+
+def find_analysis_files(navigator: FolderNavigator, domain: str, as_of_date: dt.date, max_files: int | None = None):
     domain_root = navigator.get_domain_root("analyse", domain)
     if not domain_root.exists():
         raise FileNotFoundError(f"Analysis domain folder not found: {domain_root}")
 
-    day_dir = domain_root / f"{as_of_date.year:04d}" / f"{as_of_date.month:02d}" / f"{as_of_date.day:02d}"
-    month_dir = domain_root / f"{as_of_date.year:04d}" / f"{as_of_date.month:02d}"
     year_dir = domain_root / f"{as_of_date.year:04d}"
+    month_dir = year_dir / f"{as_of_date.month:02d}"
+    day_dir = month_dir / f"{as_of_date.day:02d}"
 
     for folder in (day_dir, month_dir, year_dir):
-        if folder.exists() and folder.is_dir():
-            files = sorted(folder.glob("*.json"))
-            if files:
-                return files
+        files = _first_json_files(folder, max_files)
+        if files:
+            return files
 
     raise FileNotFoundError(
         f"No analysis JSON files found for domain '{domain}' near date '{as_of_date.isoformat()}'"
@@ -94,52 +253,144 @@ def _stringify_value(value) -> str:
     if isinstance(value, str):
         return value.strip()
     if isinstance(value, list):
-        return " | ".join(str(item) for item in value if str(item).strip())
+        return " | ".join(filter(str.strip, map(str, value)))
     return str(value).strip()
 
 
-def build_context_from_analysis(files: list[Path], max_files: int, max_chars: int):
+def _safe_load_analysis_payload(path: Path):
+    try:
+        return load_analysis_payload(path)
+    except Exception:
+        return None
+
+
+def get_llm_model() -> str:
+    return os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
+
+
+@lru_cache(maxsize=None)
+def _token_encoder(model: str):
+    # tiktoken is optional and may be unable to fetch its BPE files offline; callers then estimate.
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    encoder = _token_encoder(model)
+    if encoder is None:
+        return -(-len(text) // CHARS_PER_TOKEN_ESTIMATE)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def build_context_from_analysis(files: list[Path], max_files: int, max_chars: int, max_tokens: int = 0):
     selected = files[: max(1, max_files)]
     blocks = []
     total = 0
-    for path in selected:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8", errors="replace"))
-        except Exception:
+    total_tokens = 0
+    model = get_llm_model()
+    # Reads overlap across threads; the budget below is still applied in file order.
+    with ThreadPoolExecutor(max_workers=max(1, min(ANALYSIS_READ_WORKERS, len(selected)))) as executor:
+        payloads = list(executor.map(_safe_load_analysis_payload, selected))
+
+    for path, payload in zip(selected, payloads):
+        if payload is None:
             continue
 
         analysis = payload.get("analysis", payload)
         if not isinstance(analysis, dict):
             analysis = {"raw": analysis}
 
-        summary = _stringify_value(analysis.get("executive_summary"))
-        trends = _stringify_value(analysis.get("key_trends"))
-        delta = _stringify_value(analysis.get("delta_start_to_end"))
-        evidence = _stringify_value(analysis.get("supporting_evidence"))
-        caveats = _stringify_value(analysis.get("caveats"))
-        confidence = _stringify_value(analysis.get("confidence"))
-
-        block = (
-            f"### Source: {path.name}\n"
-            f"Summary: {summary}\n"
-            f"Trends: {trends}\n"
-            f"Delta: {delta}\n"
-            f"Evidence: {evidence}\n"
-            f"Caveats: {caveats}\n"
-            f"Confidence: {confidence}"
-        ).strip()
-
-        next_total = total + len(block)
+        fields = (
+            path.name,
+            _stringify_value(analysis.get("executive_summary")),
+            _stringify_value(analysis.get("key_trends")),
+            _stringify_value(analysis.get("delta_start_to_end")),
+            _stringify_value(analysis.get("supporting_evidence")),
+            _stringify_value(analysis.get("caveats")),
+            _stringify_value(analysis.get("confidence")),
+        )
+
+        # Exact block length without building it; only the last line can lose trailing whitespace.
+        next_total = (
+            total
+            + BLOCK_LABEL_CHARS
+            + sum(map(len, fields[:-1]))
+            + len((BLOCK_LABELS[-1] + fields[-1]).rstrip())
+        )
         if max_chars > 0 and next_total > max_chars:
             break
 
+        block = "\n".join(f"{label}{value}" for label, value in zip(BLOCK_LABELS, fields)).rstrip()
+        if max_tokens > 0:
+            next_tokens = total_tokens + count_tokens(block, model)
+            if next_tokens > max_tokens:
+                break
+            total_tokens = next_tokens
+
         blocks.append(block)
         total = next_total
 
     if not blocks:
         raise RuntimeError("No readable analysis content after bounds were applied")
 
-    return selected, "\n\n".join(blocks)
+    return selected, blocks
+
+
+def build_llm_context(blocks: list[str], marshal: bool) -> str:
+    if not marshal:
+        return "\n\n".join(blocks)
+    return "\n\n".join(
+        f"<<SOURCE {index}>>\n{block}\n<</SOURCE {index}>>" for index, block in enumerate(blocks, start=1)
+    )
+
+
+def _llm_cache_path(endpoint: str, model: str, system_prompt: str, user_prompt: str) -> Path:
+    key = "\x1f".join((endpoint, model, system_prompt, user_prompt))
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return LLM_CACHE_ROOT / f"{digest}.json"
+
+
+def load_cached_llm_payload(path: Path, ttl_seconds: float):
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        cached = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def store_cached_llm_payload(path: Path, payload: dict):
+    # Write then rename so concurrent group calls never read a half-written entry.
+    try:
+        LLM_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=LLM_CACHE_ROOT, suffix=".tmp", delete=False) as handle:
+            handle.write(json_dumps_bytes(payload))
+        os.replace(handle.name, path)
+    except OSError:
+        pass
+
+
+def build_system_message(system_prompt: str, base_url: str) -> dict:
+    # Anthropic only caches prefixes marked with cache_control; OpenAI caches long prefixes automatically.
+    if "anthropic" in base_url.lower():
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+        }
+    return {"role": "system", "content": system_prompt}
 
 
 def call_llm_slide_formatter(
@@ -148,52 +399,51 @@ def call_llm_slide_formatter(
     prompt_text: str,
     analysis_context: str,
     llm_timeout: int,
+    marshal: bool = False,
+    cache_ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
 ):
-    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is required for LLM formatting")
-
-    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
+    model = get_llm_model()
     base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").strip().rstrip("/")
     endpoint = f"{base_url}/chat/completions"
 
-    system_prompt = (
-        "You are a presentation editor. Convert analysis into concise executive slide content. "
-        "Return strict JSON only with no markdown fences and no extra keys."
-    )
-
+    # Static text first and byte-identical across calls so provider prefix caching can reuse it.
+    system_prompt = SYSTEM_PROMPT_MARSHAL if marshal else SYSTEM_PROMPT_POINTS
     user_prompt = (
         f"Domain: {domain}\n"
         f"Date: {as_of_date.isoformat()}\n"
         f"Instruction: {prompt_text}\n\n"
-        "Return strict JSON with keys:\n"
-        "- slide_title (string)\n"
-        "- main_points (array of 4 to 10 strings, concise and factual)\n"
-        "- source_note (string)\n\n"
-        "Rules:\n"
-        "- Prioritize money-linked events when available.\n"
-        "- Do not invent numbers; if uncertain, use wording like 'reported'.\n"
-        "- Keep each point under 120 characters when possible.\n\n"
         "Analysis context:\n"
         f"{analysis_context}"
     )
 
+    cache_path = None
+    if cache_ttl_seconds > 0:
+        cache_path = _llm_cache_path(endpoint, model, system_prompt, user_prompt)
+        cached = load_cached_llm_payload(cache_path, cache_ttl_seconds)
+        if cached is not None:
+            return {"model": model, "endpoint": endpoint, "payload": cached, "cache_hit": True}
+
+    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is required for LLM formatting")
+
     payload = {
         "model": model,
         "temperature": 0.2,
+        "response_format": {"type": "json_object"},
         "messages": [
-            {"role": "system", "content": system_prompt},
+            build_system_message(system_prompt, base_url),
             {"role": "user", "content": user_prompt},
         ],
     }
 
-    response = requests.post(
+    response = get_llm_session().post(
         endpoint,
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
-        json=payload,
+        data=json_dumps_bytes(payload),
         timeout=max(30, llm_timeout),
     )
     response.raise_for_status()
@@ -204,20 +454,101 @@ def call_llm_slide_formatter(
         raise RuntimeError("LLM returned empty response")
 
     cleaned = content.strip()
+    # json_object mode returns bare JSON; fences only appear from servers that ignore response_format.
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```(?:json)?", "", cleaned).strip()
-        cleaned = re.sub(r"```$", "", cleaned).strip()
+        cleaned = FENCE_HEAD_RE.sub("", cleaned).strip()
+        cleaned = FENCE_TAIL_RE.sub("", cleaned).strip()
 
     try:
-        parsed = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
+        parsed = json_loads(cleaned)
+    except ValueError as exc:
         raise RuntimeError("LLM response was not valid JSON") from exc
+    if not isinstance(parsed, dict):
+        raise RuntimeError("LLM response was not a JSON object")
+
+    if cache_path is not None:
+        store_cached_llm_payload(cache_path, parsed)
 
     return {
         "model": model,
         "endpoint": endpoint,
         "payload": parsed,
         "raw_response": cleaned,
+        "cache_hit": False,
+    }
+
+
+def interleave_points(point_lists) -> list[str]:
+    # Round-robin so every group or source is represented once the list is capped.
+    columns = [points if isinstance(points, list) else [] for points in point_lists]
+    merged = []
+    seen = set()
+    for row in zip_longest(*columns):
+        for item in row:
+            text = str(item).strip() if item is not None else ""
+            key = text.casefold()
+            if text and key not in seen:
+                seen.add(key)
+                merged.append(text)
+    return merged
+
+
+def merge_slide_payloads(payloads: list[dict]) -> dict:
+    first = payloads[0] if payloads else {}
+    merged = {
+        "slide_title": first.get("slide_title"),
+        "source_note": first.get("source_note"),
+    }
+    sources = [
+        source
+        for payload in payloads
+        if isinstance(payload.get("sources"), list)
+        for source in payload["sources"]
+    ]
+    if sources:
+        merged["sources"] = sources
+    else:
+        merged["main_points"] = interleave_points(payload.get("main_points") for payload in payloads)
+    return merged
+
+
+def format_slide_groups(
+    domain: str,
+    as_of_date: dt.date,
+    prompt_text: str,
+    context_blocks: list[str],
+    files_per_call: int,
+    marshal: bool,
+    max_parallel: int,
+    llm_timeout: int,
+    cache_ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+):
+    size = files_per_call if files_per_call > 0 else len(context_blocks)
+    groups = [context_blocks[start : start + size] for start in range(0, len(context_blocks), size)]
+
+    def format_group(blocks: list[str]):
+        return call_llm_slide_formatter(
+            domain=domain,
+            as_of_date=as_of_date,
+            prompt_text=prompt_text,
+            analysis_context=build_llm_context(blocks, marshal),
+            llm_timeout=llm_timeout,
+            marshal=marshal,
+            cache_ttl_seconds=cache_ttl_seconds,
+        )
+
+    if len(groups) == 1:
+        return format_group(groups[0])
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(groups)))) as executor:
+        results = list(executor.map(format_group, groups))
+
+    return {
+        "model": results[0]["model"],
+        "endpoint": results[0]["endpoint"],
+        "payload": merge_slide_payloads([result["payload"] for result in results]),
+        "llm_calls": len(results),
+        "cache_hit": all(result["cache_hit"] for result in results),
     }
 
 
@@ -226,26 +557,23 @@ def normalize_slide_payload(data: dict, domain: str, as_of_date: dt.date):
     source_note = str(data.get("source_note") or "Generated from analysis artifacts").strip()
 
     points_raw = data.get("main_points")
+    sources = data.get("sources")
+    if not isinstance(points_raw, list) and isinstance(sources, list):
+        points_raw = interleave_points(source.get("points") for source in sources if isinstance(source, dict))
+
     points = []
     if isinstance(points_raw, list):
         for item in points_raw:
             text = str(item).strip()
             if not text:
                 continue
-            if len(text) > 130:
-                text = text[:127].rstrip() + "..."
+            if len(text) > MAX_POINT_CHARS:
+                text = text[: MAX_POINT_CHARS - 3].rstrip() + "..."
             points.append(text)
+            if len(points) == MAX_SLIDE_POINTS:
+                break
 
-    if not points:
-        points = [
-            "No clear major events extracted from available analysis.",
-            "Review source analysis files and rerun with expanded date coverage.",
-        ]
-
-    if len(points) > 10:
-        points = points[:10]
-
-    main_text = "\n".join(f"• {item}" for item in points)
+    main_text = "\n".join(f"• {item}" for item in points) if points else FALLBACK_MAIN_TEXT
 
     return {
         "slide_title": title,
@@ -263,11 +591,12 @@ def _set_shape_text(shape, text: str):
     tf.text = text or ""
 
 
-def _find_shape_by_name(slide, name: str):
+def _shapes_by_name(slide) -> dict:
+    # First shape wins on duplicate names, as the old linear lookup did.
+    shapes = {}
     for shape in slide.shapes:
-        if shape.name == name:
-            return shape
-    return None
+        shapes.setdefault(shape.name, shape)
+    return shapes
 
 
 def render_company_profile_slide_from_template(
@@ -279,21 +608,21 @@ def render_company_profile_slide_from_template(
 ):
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    base_name = safe_name(slide_data["slide_title"], fallback=f"{domain}CompanyProfile")
-    scope = as_of_date.strftime("%Y-%m-%d")
-    pptx_path = out_dir / f"{base_name}_{scope}.pptx"
+    scope = as_of_date.isoformat()
+    stem = f"{safe_name(slide_data['slide_title'], fallback=f'{domain}CompanyProfile')}_{scope}"
+    pptx_path = out_dir / f"{stem}.pptx"
+    payload_path = out_dir / f"{stem}.json"
 
-    instantiate_template(output_dir=out_dir, output_name=pptx_path.name, overwrite=True)
-
-    prs = Presentation(str(pptx_path))
+    prs = load_template_presentation()
     if not prs.slides:
         raise RuntimeError("Template did not contain a slide")
 
     slide = prs.slides[0]
-    title_shape = _find_shape_by_name(slide, "FIELD_TITLE")
-    main_text_shape = _find_shape_by_name(slide, "FIELD_MAIN_TEXT")
-    date_shape = _find_shape_by_name(slide, "FIELD_DATE")
-    source_shape = _find_shape_by_name(slide, "FIELD_SOURCE_NOTE")
+    shapes = _shapes_by_name(slide)
+    title_shape = shapes.get("FIELD_TITLE")
+    main_text_shape = shapes.get("FIELD_MAIN_TEXT")
+    date_shape = shapes.get("FIELD_DATE")
+    source_shape = shapes.get("FIELD_SOURCE_NOTE")
 
     if title_shape is None or main_text_shape is None:
         raise RuntimeError("Template missing required named fields: FIELD_TITLE and FIELD_MAIN_TEXT")
@@ -307,15 +636,14 @@ def render_company_profile_slide_from_template(
 
     prs.save(str(pptx_path))
 
-    payload_path = out_dir / f"{base_name}_{scope}.json"
     payload = {
-        "ts": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "ts": iso_now(),
         "domain": domain,
-        "date": as_of_date.isoformat(),
-        "source_files": [str(path) for path in source_files],
+        "date": scope,
+        "source_files": source_files,
         "slide": slide_data,
     }
-    payload_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    payload_path.write_bytes(json_dumps_pretty_bytes(payload))
 
     return pptx_path, payload_path
 
@@ -332,7 +660,32 @@ def main():
     parser.add_argument("--analysis-file", default="", help="Optional path to a single analysis JSON")
     parser.add_argument("--max-analysis-files", type=int, default=6)
     parser.add_argument("--max-analysis-chars", type=int, default=18000)
+    parser.add_argument(
+        "--max-analysis-tokens",
+        type=int,
+        default=MAX_ANALYSIS_TOKENS,
+        help="Token budget for the analysis context (0 disables; uses tiktoken when installed, else ~4 chars/token)",
+    )
     parser.add_argument("--llm-timeout", type=int, default=90)
+    parser.add_argument(
+        "--files-per-call",
+        type=int,
+        default=FILES_PER_CALL,
+        help="Analysis files per LLM call; larger inputs become concurrent calls (0 = one call for all)",
+    )
+    parser.add_argument(
+        "--no-marshal",
+        action="store_true",
+        help="Ask for one flat bullet list instead of numbered per-source points",
+    )
+    parser.add_argument("--max-parallel", type=int, default=4, help="Max concurrent LLM calls when splitting")
+    parser.add_argument(
+        "--cache-ttl-seconds",
+        type=int,
+        default=LLM_CACHE_TTL_SECONDS,
+        help="Reuse an identical LLM response for this many seconds",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM and do not store the response")
 
     try:
         args = parser.parse_args()
@@ -370,20 +723,30 @@ def main():
                 raise FileNotFoundError(f"Analysis file not found: {candidate}")
             files = [candidate]
         else:
-            files = find_analysis_files(navigator=navigator, domain=domain, as_of_date=as_of_date)
+            files = find_analysis_files(
+                navigator=navigator,
+                domain=domain,
+                as_of_date=as_of_date,
+                max_files=max(1, args.max_analysis_files),
+            )
 
-        selected_files, context = build_context_from_analysis(
+        selected_files, context_blocks = build_context_from_analysis(
             files=files,
             max_files=max(1, args.max_analysis_files),
             max_chars=max(1000, args.max_analysis_chars),
+            max_tokens=max(0, args.max_analysis_tokens),
         )
 
-        llm_result = call_llm_slide_formatter(
+        llm_result = format_slide_groups(
             domain=domain,
             as_of_date=as_of_date,
             prompt_text=prompt_text,
-            analysis_context=context,
+            context_blocks=context_blocks,
+            files_per_call=args.files_per_call,
+            marshal=not args.no_marshal,
+            max_parallel=args.max_parallel,
             llm_timeout=max(30, args.llm_timeout),
+            cache_ttl_seconds=0 if args.no_cache else args.cache_ttl_seconds,
         )
 
         slide_data = normalize_slide_payload(
@@ -415,6 +778,7 @@ def main():
                     "analysis_files": [str(path) for path in selected_files],
                     "presentation_path": str(presentation_path),
                     "payload_path": str(payload_path),
+                    "cache_hit": llm_result["cache_hit"],
                     "status": "ok",
                 },
                 ensure_ascii=False,
@@ -2,16 +2,29 @@
 """Gen2ReportAnalysis - Domain/timeframe LLM analysis with markdown report output."""
 
 import argparse
+import codecs
 import datetime as dt
+import hashlib
+import io
 import json
 import os
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SKILLS_ROOT = Path(__file__).resolve().parent.parent
 if str(SKILLS_ROOT) not in sys.path:
@@ -19,6 +32,53 @@ if str(SKILLS_ROOT) not in sys.path:
 
 from CommonCode.FolderNavigator import FolderNavigator
 
+CORPUS_READ_WORKERS = 16
+SHARED_PREFIX_SCAN_CHARS = 512
+SHARED_PREFIX_MIN_CHARS = 64
+
+LLM_CACHE_ROOT = Path(__file__).resolve().parents[3] / "cache" / "Gen2ReportAnalysis"
+LLM_CACHE_TTL_DAYS = 7
+
+DOMAIN_RE = re.compile(r"[A-Za-z]+")
+NAME_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def build_llm_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+LLM_SESSION = build_llm_session()
+
+
+def json_dumps_bytes(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass(frozen=True)
 class Timeframe:
@@ -40,11 +100,19 @@ def validate_domain(domain: str) -> str:
     if not domain or not isinstance(domain, str):
         raise ValueError("Domain must be a non-empty string")
     cleaned = domain.strip()
-    if not re.fullmatch(r"[A-Za-z]+", cleaned):
+    if not DOMAIN_RE.fullmatch(cleaned):
         raise ValueError("Domain must be alphabetic only (A-Z, a-z)")
     return cleaned
 
 
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    if not (1 <= year <= 9999 and 1 <= month <= 12):
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= DAYS_IN_MONTH[month]
+
+
 def parse_timeframe(value: str) -> Timeframe:
     cleaned = (value or "").strip().replace("-", "/")
     if not cleaned:
@@ -77,23 +145,26 @@ def parse_timeframe(value: str) -> Timeframe:
 
     try:
         day = int(parts[2])
-        dt.date(year, month, day)
     except ValueError as exc:
         raise ValueError("Invalid day for given year/month") from exc
+    if not is_valid_date(year, month, day):
+        raise ValueError("Invalid day for given year/month")
 
     return Timeframe(scope="day", year=year, month=month, day=day)
 
 
 def safe_name(text: str, fallback: str = "ReportAnalysis") -> str:
-    tokens = re.findall(r"[A-Za-z0-9]+", text or "")
-    if not tokens:
-        return fallback
+    # capitalize() leaves digit-only tokens unchanged, and tokens past the 80-char cap are never touched.
     parts = []
-    for token in tokens:
-        if token.isdigit():
-            parts.append(token)
-        else:
-            parts.append(token[0].upper() + token[1:].lower())
+    length = 0
+    for match in NAME_TOKEN_RE.finditer(text or ""):
+        token = match.group().capitalize()
+        parts.append(token)
+        length += len(token)
+        if length >= 80:
+            break
+    if not parts:
+        return fallback
     return "".join(parts)[:80]
 
 
@@ -101,96 +172,222 @@ def normalize_heading(value: str, fallback: str = "Section") -> str:
     text = (value or "").strip()
     if not text:
         return fallback
-    text = re.sub(r"\s+", " ", text)
+    text = WHITESPACE_RE.sub(" ", text)
     return text[:120]
 
 
-def extract_date_from_mine_path(path: Path, mine_domain_root: Path) -> dt.date | None:
+def _numeric_subdirs(path: str, width: int) -> List[tuple[int, str]]:
     try:
-        rel = path.relative_to(mine_domain_root)
-    except Exception:
-        return None
-
-    if len(rel.parts) < 4:
-        return None
-
-    year_part, month_part, day_part = rel.parts[0], rel.parts[1], rel.parts[2]
-    if not (year_part.isdigit() and len(year_part) == 4):
-        return None
-    if not (month_part.isdigit() and len(month_part) == 2):
-        return None
-    if not (day_part.isdigit() and len(day_part) == 2):
-        return None
-
-    try:
-        return dt.date(int(year_part), int(month_part), int(day_part))
-    except ValueError:
-        return None
-
-
-def date_matches_timeframe(value: dt.date, timeframe: Timeframe) -> bool:
-    if timeframe.scope == "year":
-        return value.year == timeframe.year
-    if timeframe.scope == "month":
-        return value.year == timeframe.year and value.month == timeframe.month
-    return value.year == timeframe.year and value.month == timeframe.month and value.day == timeframe.day
+        with os.scandir(path) as entries:
+            return [
+                (int(entry.name), entry.path)
+                for entry in entries
+                if len(entry.name) == width and entry.name.isdigit() and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def _txt_files_under(path: str) -> List[str]:
+    found = []
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".txt") and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return found
 
 
-def collect_files(navigator: FolderNavigator, domain: str, timeframe: Timeframe, max_files: int) -> List[tuple[dt.date, Path]]:
-    mine_domain_root = navigator.get_domain_root("mine", domain)
+def collect_files(mine_domain_root: Path, timeframe: Timeframe, max_files: int) -> List[tuple[dt.date, Path]]:
     if not mine_domain_root.exists():
         raise FileNotFoundError(f"Mine domain folder not found: {mine_domain_root}")
 
+    # Only descend into the YYYY/MM/DD folders the timeframe can match.
+    year_path = os.path.join(mine_domain_root, f"{timeframe.year:04d}")
+    if timeframe.scope == "year":
+        months = _numeric_subdirs(year_path, 2)
+    else:
+        months = [(timeframe.month, os.path.join(year_path, f"{timeframe.month:02d}"))]
+
     matched = []
-    for path in sorted(mine_domain_root.glob("**/*.txt")):
-        date_value = extract_date_from_mine_path(path, mine_domain_root)
-        if not date_value:
-            continue
-        if date_matches_timeframe(date_value, timeframe):
-            matched.append((date_value, path))
+    for month, month_path in months:
+        if timeframe.scope == "day":
+            days = [(timeframe.day, os.path.join(month_path, f"{timeframe.day:02d}"))]
+        else:
+            days = _numeric_subdirs(month_path, 2)
 
-    matched.sort(key=lambda item: (item[0], str(item[1]).lower()))
+        for day, day_path in days:
+            # Validate with integers; the date object is built once per day folder, not per file.
+            if not is_valid_date(timeframe.year, month, day):
+                continue
+            date_value = dt.date(timeframe.year, month, day)
+            matched.extend((date_value, file_path.lower(), file_path) for file_path in _txt_files_under(day_path))
+
+    # Sort on precomputed keys; the raw path breaks case-insensitive ties the way the old sorted glob did.
+    matched.sort()
     if max_files > 0:
         matched = matched[:max_files]
-    return matched
+    return [(date_value, Path(file_path)) for date_value, _, file_path in matched]
+
+
+def _clip_corpus_text(text: str, max_chars: int) -> str:
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    raw = text.strip()
+    if max_chars > 0 and len(raw) > max_chars:
+        raw = raw[:max_chars].rstrip() + "\n…"
+    return raw
+
+
+def _read_corpus_file(path: Path, max_chars: int) -> str | None:
+    try:
+        with path.open("rb") as handle:
+            if max_chars <= 0:
+                return _clip_corpus_text(handle.read().decode("utf-8", errors="replace"), max_chars)
+
+            # A UTF-8 char is at most 4 bytes, so a full window holds more than max_chars chars.
+            limit = 4 * (max_chars + 1)
+            data = handle.read(limit)
+            if len(data) == limit:
+                # The incremental decoder holds back a char split by the window instead of replacing it.
+                head = codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data)
+                head = head.replace("\r\n", "\n").replace("\r", "\n").lstrip()
+                # Non-blank text past the cap means the whole file truncates at the same point.
+                if head[max_chars:].strip():
+                    return head[:max_chars].rstrip() + "\n…"
+                # Leading or trailing blanks filled the window; only the full text can decide.
+                data += handle.read()
+    except Exception:
+        return None
+
+    return _clip_corpus_text(data.decode("utf-8", errors="replace"), max_chars)
+
+
+def shared_line_prefix(raws: list[str]) -> str:
+    # Whole leading lines repeated in every file (banners, crawl metadata) are sent to the LLM once.
+    if len(raws) < 2:
+        return ""
+    prefix = os.path.commonprefix([raw[:SHARED_PREFIX_SCAN_CHARS] for raw in raws])
+    prefix = prefix[: prefix.rfind("\n") + 1]
+    return prefix if len(prefix) >= SHARED_PREFIX_MIN_CHARS else ""
 
 
 def build_corpus(files: List[tuple[dt.date, Path]], max_chars_per_file: int, max_total_chars: int):
-    blocks = []
+    # Parallel lists: block text for the prompt, (date, path) for reporting.
+    # Sized for every file up front and trimmed to the kept count afterwards.
+    block_texts = [None] * len(files)
+    block_meta = [None] * len(files)
+    selected = [None] * len(files)
+    kept = 0
     total = 0
 
-    for index, (date_value, path) in enumerate(files, start=1):
-        try:
-            raw = path.read_text(encoding="utf-8", errors="replace").strip()
-        except Exception:
-            continue
+    executor = ThreadPoolExecutor(max_workers=CORPUS_READ_WORKERS)
+    try:
+        # map() yields in input order, so the budget still cuts at the same file.
+        contents = executor.map(lambda path: _read_corpus_file(path, max_chars_per_file), [path for _, path in files])
+        for index, (date_value, path) in enumerate(files, start=1):
+            header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
+            # A block is never shorter than its header, so once that alone overflows the
+            # budget the loop can stop without waiting on this file's read.
+            if max_total_chars > 0 and total + len(header) > max_total_chars and path.is_file():
+                break
 
-        if max_chars_per_file > 0 and len(raw) > max_chars_per_file:
-            raw = raw[:max_chars_per_file].rstrip() + "\n…"
+            raw = next(contents)
+            if raw is None:
+                continue
 
-        header = f"### File {index} | Date {date_value.isoformat()} | Name {path.name}"
-        block = f"{header}\n{raw}".strip()
+            block = f"{header}\n{raw}".strip()
 
-        next_total = total + len(block)
-        if max_total_chars > 0 and next_total > max_total_chars:
-            break
+            next_total = total + len(block)
+            if max_total_chars > 0 and next_total > max_total_chars:
+                break
 
-        blocks.append({"date": date_value.isoformat(), "path": str(path), "text": block})
-        total = next_total
+            block_texts[kept] = block
+            block_meta[kept] = (date_value.isoformat(), str(path))
+            selected[kept] = (header, raw)
+            kept += 1
+            total = next_total
+    finally:
+        # Files queued behind the budget cut-off are never read.
+        executor.shutdown(wait=True, cancel_futures=True)
 
-    return blocks
+    del block_texts[kept:], block_meta[kept:], selected[kept:]
 
+    prefix = shared_line_prefix([raw for _, raw in selected])
+    if prefix:
+        block_texts = [f"{header}\n{raw[len(prefix):]}".strip() for header, raw in selected]
+        # Riding on the first block keeps block_texts parallel to block_meta.
+        block_texts[0] = f"### Shared header (removed from the start of every file)\n{prefix.strip()}\n\n{block_texts[0]}"
+
+    return block_texts, block_meta
 
-def call_llm_for_report(prompt_text: str, timeframe: Timeframe, domain: str, corpus_blocks, llm_timeout_seconds: int):
-    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is required for LLM analysis")
 
+def _llm_cache_path(endpoint: str, model: str, system_prompt: str, user_prompt: str) -> Path:
+    key = json.dumps([endpoint, model, system_prompt, user_prompt], ensure_ascii=False)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return LLM_CACHE_ROOT / f"{digest}.json"
+
+
+def load_cached_llm_payload(path: Path, ttl_seconds: float) -> dict | None:
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        cached = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def store_cached_llm_payload(path: Path, payload: dict):
+    # Write then rename so a concurrent run never reads a half-written entry.
+    try:
+        LLM_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=LLM_CACHE_ROOT, suffix=".tmp", delete=False) as handle:
+            handle.write(json_dumps_bytes(payload))
+        os.replace(handle.name, path)
+    except OSError:
+        pass
+
+
+def read_chat_completion(response) -> str:
+    # Servers that ignore "stream" answer with a plain completion body.
+    content_type = response.headers.get("content-type", "").lower()
+    if "text/event-stream" not in content_type:
+        body = json_loads(response.content)
+        return body.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+    buffer = io.StringIO()
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = json_loads(data).get("choices") or [{}]
+        buffer.write((choices[0].get("delta") or {}).get("content") or "")
+    return buffer.getvalue()
+
+
+def call_llm_for_report(
+    prompt_text: str,
+    timeframe: Timeframe,
+    domain: str,
+    corpus_texts: list[str],
+    llm_timeout_seconds: int,
+    cache_ttl_days: float = LLM_CACHE_TTL_DAYS,
+):
     model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
     base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").strip().rstrip("/")
     endpoint = f"{base_url}/chat/completions"
 
-    corpus_text = "\n\n".join(item["text"] for item in corpus_blocks)
+    corpus_text = "\n\n".join(corpus_texts)
 
     system_prompt = (
         "You are a rigorous analyst producing a formal report structure. "
@@ -215,48 +412,65 @@ def call_llm_for_report(prompt_text: str, timeframe: Timeframe, domain: str, cor
         f"{corpus_text}"
     )
 
+    cache_path = None
+    if cache_ttl_days > 0:
+        cache_path = _llm_cache_path(endpoint, model, system_prompt, user_prompt)
+        cached = load_cached_llm_payload(cache_path, cache_ttl_days * 86400)
+        if cached is not None:
+            return {"model": model, "endpoint": endpoint, "payload": cached, "cached": True}
+
+    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is required for LLM analysis")
+
     payload = {
         "model": model,
         "temperature": 0.2,
+        "stream": True,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
     }
 
-    response = requests.post(
+    with LLM_SESSION.post(
         endpoint,
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
-        json=payload,
+        data=json_dumps_bytes(payload),
         timeout=max(30, llm_timeout_seconds),
-    )
-    response.raise_for_status()
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        content = read_chat_completion(response)
 
-    body = response.json()
-    content = body.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not content:
         raise RuntimeError("LLM returned empty response")
 
     cleaned = content.strip()
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```(?:json)?", "", cleaned).strip()
-        cleaned = re.sub(r"```$", "", cleaned).strip()
+        cleaned = cleaned[3:].removeprefix("json").strip()
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3].rstrip()
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = json_loads(cleaned)
     except json.JSONDecodeError as exc:
         raise RuntimeError("LLM response was not valid JSON") from exc
 
     if not isinstance(parsed, dict):
         raise RuntimeError("LLM response must be a JSON object")
 
+    if cache_path is not None:
+        store_cached_llm_payload(cache_path, parsed)
+
     return {
         "model": model,
         "endpoint": endpoint,
         "payload": parsed,
+        "cached": False,
     }
 
 
@@ -266,6 +480,7 @@ def normalize_sections(raw_payload: dict) -> list[dict]:
         raise RuntimeError("LLM JSON must include non-empty 'sections' array")
 
     normalized = []
+    first_lower = last_lower = ""
     for entry in raw_sections:
         if not isinstance(entry, dict):
             continue
@@ -273,23 +488,29 @@ def normalize_sections(raw_payload: dict) -> list[dict]:
         title = normalize_heading(entry.get("title", ""), fallback="Section")
         paragraphs_raw = entry.get("paragraphs")
         if isinstance(paragraphs_raw, list):
-            paragraphs = [re.sub(r"\s+", " ", str(p or "")).strip() for p in paragraphs_raw if str(p or "").strip()]
+            paragraphs = [WHITESPACE_RE.sub(" ", str(p or "")).strip() for p in paragraphs_raw if str(p or "").strip()]
         else:
-            single = re.sub(r"\s+", " ", str(paragraphs_raw or "")).strip()
+            single = WHITESPACE_RE.sub(" ", str(paragraphs_raw or "")).strip()
             paragraphs = [single] if single else []
 
         if not paragraphs:
             continue
 
+        # normalize_heading already strips, so the lowered title is compared as-is.
+        last_lower = title.lower()
+        if not normalized:
+            first_lower = last_lower
         normalized.append({"title": title, "paragraphs": paragraphs})
 
     if not normalized:
         raise RuntimeError("LLM returned no valid sections")
 
-    first_title = normalized[0]["title"].strip().lower()
-    last_title = normalized[-1]["title"].strip().lower()
+    has_intro = first_lower == "introduction"
+    has_summary = last_lower == "summary"
 
-    if first_title != "introduction":
+    if has_intro:
+        normalized[0]["title"] = "Introduction"
+    else:
         normalized.insert(
             0,
             {
@@ -300,7 +521,9 @@ def normalize_sections(raw_payload: dict) -> list[dict]:
             },
         )
 
-    if last_title != "summary":
+    if has_summary:
+        normalized[-1]["title"] = "Summary"
+    else:
         normalized.append(
             {
                 "title": "Summary",
@@ -310,50 +533,45 @@ def normalize_sections(raw_payload: dict) -> list[dict]:
             }
         )
 
-    normalized[0]["title"] = "Introduction"
-    normalized[-1]["title"] = "Summary"
-
+    # Titles are already canonical at both ends, so trimming keeps them.
     if len(normalized) > 10:
         normalized = normalized[:9] + [normalized[-1]]
-        normalized[0]["title"] = "Introduction"
-        normalized[-1]["title"] = "Summary"
 
     return normalized
 
 
-def render_markdown_report(domain: str, timeframe: Timeframe, prompt_text: str, sections: list[dict], input_files: list[str]) -> str:
-    lines = []
-    lines.append(f"# {domain} Report ({timeframe.normalized})")
-    lines.append("")
-    lines.append(f"Prompt focus: {prompt_text}")
-    lines.append("")
-    lines.append("## Table of Contents")
-    lines.append("")
+def render_markdown_report(
+    fh,
+    domain: str,
+    timeframe: Timeframe,
+    prompt_text: str,
+    sections: list[dict],
+    input_files: list[str],
+) -> None:
+    # Written line by line so the report is never held as one string.
+    fh.write(f"# {domain} Report ({timeframe.normalized})\n\n")
+    fh.write(f"Prompt focus: {prompt_text}\n\n")
+    fh.write("## Table of Contents\n\n")
 
     for index, section in enumerate(sections, start=1):
-        lines.append(f"{index}. {section['title']} .... paragraph {index}")
+        fh.write(f"{index}. {section['title']} .... paragraph {index}\n")
 
-    lines.append("")
+    fh.write("\n")
     for index, section in enumerate(sections, start=1):
-        lines.append(f"## {index}. {section['title']}")
-        lines.append("")
+        fh.write(f"## {index}. {section['title']}\n\n")
         for paragraph in section["paragraphs"]:
-            lines.append(paragraph)
-            lines.append("")
-
-    lines.append("---")
-    lines.append("")
-    lines.append("### Source Context")
-    lines.append("")
-    lines.append(f"- Domain: {domain}")
-    lines.append(f"- Timeframe: {timeframe.normalized}")
-    lines.append(f"- Source files used: {len(input_files)}")
+            fh.write(paragraph)
+            fh.write("\n\n")
 
-    return "\n".join(lines).rstrip() + "\n"
+    fh.write("---\n\n")
+    fh.write("### Source Context\n\n")
+    fh.write(f"- Domain: {domain}\n")
+    fh.write(f"- Timeframe: {timeframe.normalized}\n")
+    fh.write(f"- Source files used: {len(input_files)}\n")
 
 
-def timeframe_output_dir(navigator: FolderNavigator, domain: str, timeframe: Timeframe) -> Path:
-    root = navigator.get_domain_root("analyse", domain, create=True)
+def timeframe_output_dir(root: Path, timeframe: Timeframe) -> Path:
+    # mkdir(parents=True) below also creates the domain root when it is missing.
     if timeframe.scope == "year":
         path = root / f"{timeframe.year:04d}"
     elif timeframe.scope == "month":
@@ -365,27 +583,27 @@ def timeframe_output_dir(navigator: FolderNavigator, domain: str, timeframe: Tim
 
 
 def write_output(
-    navigator: FolderNavigator,
+    analyse_domain_root: Path,
     domain: str,
     timeframe: Timeframe,
     prompt_text: str,
     sections: list[dict],
     files: list[tuple[dt.date, Path]],
 ):
-    out_dir = timeframe_output_dir(navigator, domain, timeframe)
+    out_dir = timeframe_output_dir(analyse_domain_root, timeframe)
     prompt_name = safe_name(prompt_text, fallback="ReportAnalysis")
     scope_token = timeframe.normalized.replace("/", "-")
     out_path = out_dir / f"{prompt_name}_{scope_token}.md"
 
-    markdown = render_markdown_report(
-        domain=domain,
-        timeframe=timeframe,
-        prompt_text=prompt_text,
-        sections=sections,
-        input_files=[str(item[1]) for item in files],
-    )
-
-    out_path.write_text(markdown, encoding="utf-8")
+    with out_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        render_markdown_report(
+            fh,
+            domain=domain,
+            timeframe=timeframe,
+            prompt_text=prompt_text,
+            sections=sections,
+            input_files=[str(item[1]) for item in files],
+        )
     return out_path
 
 
@@ -398,6 +616,8 @@ def main():
     parser.add_argument("--max-chars-per-file", type=int, default=6000)
     parser.add_argument("--max-total-chars", type=int, default=180000)
     parser.add_argument("--llm-timeout", type=int, default=90)
+    parser.add_argument("--cache-ttl-days", type=float, default=LLM_CACHE_TTL_DAYS, help="Reuse identical LLM results for this many days")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM and do not store the result")
 
     try:
         args = parser.parse_args()
@@ -412,24 +632,26 @@ def main():
             raise ValueError("Prompt must be non-empty")
     except Exception as exc:
         print(
-            json.dumps(
+            json_dumps_bytes(
                 {
                     "domain": args.domain if hasattr(args, "domain") else "",
                     "timeframe": args.timeframe if hasattr(args, "timeframe") else "",
                     "error": str(exc),
                     "status": "error",
-                },
-                ensure_ascii=False,
-            )
+                }
+            ).decode("utf-8")
         )
         return 1
 
     navigator = FolderNavigator.from_fixed_point()
 
     try:
+        # Resolved once here; collect_files and write_output take the roots directly.
+        mine_domain_root = navigator.get_domain_root("mine", domain)
+        analyse_domain_root = navigator.get_domain_root("analyse", domain)
+
         files = collect_files(
-            navigator=navigator,
-            domain=domain,
+            mine_domain_root=mine_domain_root,
             timeframe=timeframe,
             max_files=max(1, args.max_files),
         )
@@ -438,26 +660,27 @@ def main():
                 f"No input .txt files found for domain '{domain}' and timeframe '{timeframe.normalized}'"
             )
 
-        corpus_blocks = build_corpus(
+        corpus_texts, corpus_meta = build_corpus(
             files=files,
             max_chars_per_file=max(500, args.max_chars_per_file),
             max_total_chars=max(2000, args.max_total_chars),
         )
-        if not corpus_blocks:
+        if not corpus_texts:
             raise RuntimeError("No readable corpus content after bounds were applied")
 
         llm_result = call_llm_for_report(
             prompt_text=prompt_text,
             timeframe=timeframe,
             domain=domain,
-            corpus_blocks=corpus_blocks,
+            corpus_texts=corpus_texts,
             llm_timeout_seconds=args.llm_timeout,
+            cache_ttl_days=0 if args.no_cache else args.cache_ttl_days,
         )
 
         sections = normalize_sections(llm_result["payload"])
 
         out_path = write_output(
-            navigator=navigator,
+            analyse_domain_root=analyse_domain_root,
             domain=domain,
             timeframe=timeframe,
             prompt_text=prompt_text,
@@ -466,31 +689,30 @@ def main():
         )
 
         print(
-            json.dumps(
+            json_dumps_bytes(
                 {
                     "domain": domain,
                     "timeframe": timeframe.normalized,
-                    "files_analyzed": len(corpus_blocks),
+                    "files_analyzed": len(corpus_meta),
                     "sections": len(sections),
                     "output_path": str(out_path),
+                    "cached": llm_result["cached"],
                     "status": "ok",
-                },
-                ensure_ascii=False,
-            )
+                }
+            ).decode("utf-8")
         )
         return 0
 
     except Exception as exc:
         print(
-            json.dumps(
+            json_dumps_bytes(
                 {
                     "domain": domain,
                     "timeframe": timeframe.normalized,
                     "error": str(exc),
                     "status": "error",
-                },
-                ensure_ascii=False,
-            )
+                }
+            ).decode("utf-8")
         )
         return 1
 
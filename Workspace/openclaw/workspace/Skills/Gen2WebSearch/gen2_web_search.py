@@ -3,14 +3,20 @@
 
 import argparse
 import datetime as dt
+import gzip
+import hashlib
 import html
 import json
+import os
 import random
 import re
 import sys
+import tempfile
+import threading
 import time
 import urllib.parse
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 SKILLS_ROOT = Path(__file__).resolve().parent.parent
@@ -21,7 +27,8 @@ from CommonCode.FolderNavigator import FolderNavigator
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, CData, NavigableString, Tag
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print(
         json.dumps(
@@ -44,6 +51,13 @@ try:
 except ImportError:
     Document = None
 
+try:
+    import lxml.html
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml = None
+    HTML_PARSER = "html.parser"
+
 DDG_URL = "https://duckduckgo.com/html/?q={q}"
 BING_NEWS_RSS_URL = "https://www.bing.com/news/search"
 
@@ -51,12 +65,27 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
-    "Connection": "close",
 }
 
 MIN_REQUEST_DELAY_SECONDS = 3.0
 MAX_REQUEST_DELAY_SECONDS = 5.0
 
+HTTP_POOL_SIZE = 16
+MAX_FETCH_WORKERS = 8
+MAX_SEARCH_WORKERS = 4
+# A Bing attempt sent while a higher-priority attempt is still pending is speculative; a short
+# timeout bounds how long an unneeded in-flight request can hold the process open at exit.
+BING_FALLBACK_TIMEOUT_SECONDS = 8
+
+# Only the start of a page is read; summaries need a few hundred words, not multi-megabyte bodies.
+MAX_PAGE_BYTES = 1 << 20
+MAX_PAGE_CONTENT_LENGTH = 16 << 20
+PAGE_READ_CHUNK_BYTES = 64 << 10
+
+PAGE_CACHE_ROOT = Path(__file__).resolve().parents[3] / "cache" / "Gen2WebSearch"
+PAGE_CACHE_MAX_AGE_SECONDS = 3600
+PAGE_CACHE_MAX_PAGES = 512
+
 REDIRECT_PATTERN = re.compile(r"/l/\?uddg=([^&\"'>]+)")
 ANCHOR_PATTERN = re.compile(
     r'<a[^>]+class="result__a"[^>]+href="([^"]+)"[^>]*>(.*?)</a>',
@@ -67,7 +96,16 @@ SNIPPET_PATTERN = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 TAG_PATTERN = re.compile(r"<[^>]+>")
+RESULT_ANCHOR_XPATH = "//a[contains(concat(' ', normalize-space(@class), ' '), ' result__a ')]"
+RESULT_SNIPPET_XPATH = "//*[contains(concat(' ', normalize-space(@class), ' '), ' result__snippet ')]"
 WHITESPACE_PATTERN = re.compile(r"\s+")
+QUERY_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+LATEST_PATTERN = re.compile(r"\blatest\b", re.IGNORECASE)
+AWARDS_PATTERN = re.compile(r"\bawards\b", re.IGNORECASE)
+
+# UTF-8 punctuation mis-decoded as Latin-1: NBSP prefix, right single quote, en dash.
+MOJIBAKE_REPLACEMENTS = {"\u00c2": " ", "\u00e2\u0080\u0099": "'", "\u00e2\u0080\u0093": "-"}
+MOJIBAKE_PATTERN = re.compile("|".join(map(re.escape, MOJIBAKE_REPLACEMENTS)))
 
 NOISE_TAGS = {
     "script", "style", "noscript", "meta", "link", "nav", "header", "footer",
@@ -84,6 +122,29 @@ CONTENT_HINTS = [
     "content", "article", "story", "main", "body", "post", "entry", "headline", "news"
 ]
 
+# One regex scan per attribute string instead of a Python substring test per hint.
+NOISE_HINT_PATTERN = re.compile("|".join(map(re.escape, NOISE_HINTS)))
+CONTENT_HINT_PATTERN = re.compile("|".join(map(re.escape, CONTENT_HINTS)))
+
+# String types get_text() includes for section/div/main/article (comments, scripts etc. are skipped).
+WORD_COUNT_STRING_TYPES = (NavigableString, CData)
+
+
+def build_session():
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+# Earliest time the next request to each host may start; requests to different hosts never wait on each other.
+HOST_NEXT_REQUEST = {}
+HOST_PACING_LOCK = threading.Lock()
+
 
 def validate_domain(domain):
     if not domain or not isinstance(domain, str):
@@ -127,33 +188,131 @@ def decode_redirect_url(redirect_url):
     return redirect_url
 
 
-def fetch_url_text(url, timeout_seconds):
-    time.sleep(random.uniform(MIN_REQUEST_DELAY_SECONDS, MAX_REQUEST_DELAY_SECONDS))
-    response = requests.get(
+def wait_for_host_slot(url, cancel_event=None, initial_delay=False):
+    host = urllib.parse.urlsplit(url).netloc.lower()
+    with HOST_PACING_LOCK:
+        now = time.monotonic()
+        first_start = now
+        if initial_delay:
+            # Search engines also get a random delay before the first request, so parallel
+            # runs (each with its own pacing state) do not hit them at the same instant.
+            first_start += random.uniform(MIN_REQUEST_DELAY_SECONDS, MAX_REQUEST_DELAY_SECONDS)
+        start = max(now, HOST_NEXT_REQUEST.get(host, first_start))
+        HOST_NEXT_REQUEST[host] = start + random.uniform(MIN_REQUEST_DELAY_SECONDS, MAX_REQUEST_DELAY_SECONDS)
+    if cancel_event is not None:
+        if cancel_event.wait(max(0.0, start - now)):
+            raise RuntimeError("Request cancelled")
+    elif start > now:
+        time.sleep(start - now)
+
+
+def _page_cache_path(url):
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return PAGE_CACHE_ROOT / f"{digest}.json.gz"
+
+
+def load_cached_page(url, max_age_seconds):
+    path = _page_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= max_age_seconds:
+            return None
+        page = json.loads(gzip.decompress(path.read_bytes()))
+        return page["text"], page["content_type"], page["final_url"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_cached_page(url, text, content_type, final_url):
+    payload = json.dumps({"text": text, "content_type": content_type, "final_url": final_url}, ensure_ascii=False)
+    # Write then rename so a concurrent run never reads a half-written entry.
+    try:
+        PAGE_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=PAGE_CACHE_ROOT, suffix=".tmp", delete=False) as handle:
+            handle.write(gzip.compress(payload.encode("utf-8"), compresslevel=5))
+        os.replace(handle.name, _page_cache_path(url))
+    except OSError:
+        pass
+
+
+def prune_page_cache(max_pages=PAGE_CACHE_MAX_PAGES):
+    try:
+        cache_files = list(PAGE_CACHE_ROOT.iterdir())
+    except OSError:
+        return
+
+    # mtime is the fetch time, so the oldest fetches are dropped first.
+    pages = []
+    for path in cache_files:
+        try:
+            pages.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+
+    pages.sort(reverse=True)
+    for _, path in pages[max_pages:]:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def fetch_url_text(url, timeout_seconds, max_age_seconds=0, cancel_event=None, initial_delay=False):
+    # A fresh cache hit skips both the politeness delay and the request.
+    if max_age_seconds > 0:
+        cached = load_cached_page(url, max_age_seconds)
+        if cached is not None:
+            return cached
+
+    wait_for_host_slot(url, cancel_event, initial_delay)
+    with SESSION.get(
         url,
-        headers=HEADERS,
         timeout=timeout_seconds,
         allow_redirects=True,
         verify=True,
-    )
-    response.raise_for_status()
-    content_type = response.headers.get("content-type", "").lower()
-    return response.text, content_type, response.url
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "").lower()
+        final_url = response.url
+
+        # Non-HTML bodies are never used, so they are not downloaded.
+        if content_type and "html" not in content_type:
+            return "", content_type, final_url
+
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > MAX_PAGE_CONTENT_LENGTH:
+            raise ValueError(f"Response too large ({content_length} bytes)")
+
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=PAGE_READ_CHUNK_BYTES):
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                del body[MAX_PAGE_BYTES:]
+                break
+        try:
+            text = body.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            text = body.decode("utf-8", errors="replace")
+
+    if max_age_seconds > 0:
+        store_cached_page(url, text, content_type, final_url)
+    return text, content_type, final_url
 
 
-def fetch_duckduckgo_html(query, timeout_seconds):
+def fetch_duckduckgo_html(query, timeout_seconds, cancel_event=None):
     encoded_query = urllib.parse.quote_plus(query)
     search_url = DDG_URL.format(q=encoded_query)
-    html_text, _, _ = fetch_url_text(search_url, timeout_seconds)
+    html_text, _, _ = fetch_url_text(search_url, timeout_seconds, cancel_event=cancel_event, initial_delay=True)
     return html_text
 
 
-def fetch_bing_news_rss(query, timeout_seconds):
-    time.sleep(random.uniform(MIN_REQUEST_DELAY_SECONDS, MAX_REQUEST_DELAY_SECONDS))
-    response = requests.get(
+def fetch_bing_news_rss(query, timeout_seconds, cancel_event=None, earlier_attempts=()):
+    wait_for_host_slot(BING_NEWS_RSS_URL, cancel_event, initial_delay=True)
+    if not all(attempt.done() for attempt in earlier_attempts):
+        timeout_seconds = min(timeout_seconds, BING_FALLBACK_TIMEOUT_SECONDS)
+    response = SESSION.get(
         BING_NEWS_RSS_URL,
         params={"q": query, "format": "rss", "mkt": "en-US"},
-        headers=HEADERS,
         timeout=timeout_seconds,
         allow_redirects=True,
         verify=True,
@@ -162,10 +321,23 @@ def fetch_bing_news_rss(query, timeout_seconds):
     return response.text
 
 
+def _element_text(element):
+    # text_content() is already tag-stripped and entity-decoded.
+    return WHITESPACE_PATTERN.sub(" ", element.text_content()).strip()
+
+
 def extract_results_from_html(html_text, max_count):
     if not html_text:
         return []
 
+    if lxml is not None:
+        try:
+            tree = lxml.html.fromstring(html_text)
+        except Exception:
+            tree = None
+        if tree is not None:
+            return _extract_results_from_tree(tree, max_count)
+
     results = []
     anchors = list(ANCHOR_PATTERN.finditer(html_text))
     snippets = list(SNIPPET_PATTERN.finditer(html_text))
@@ -201,6 +373,36 @@ def extract_results_from_html(html_text, max_count):
     return results
 
 
+def _extract_results_from_tree(tree, max_count):
+    anchors = tree.xpath(RESULT_ANCHOR_XPATH)
+    snippets = tree.xpath(RESULT_SNIPPET_XPATH)
+
+    results = []
+    for index, anchor in enumerate(anchors):
+        if len(results) >= max_count:
+            break
+
+        title = _element_text(anchor)
+        url = decode_redirect_url(anchor.get("href", ""))
+        if not title or not url or url.startswith("/"):
+            continue
+
+        snippet = ""
+        if index < len(snippets):
+            snippet = _element_text(snippets[index])
+
+        results.append(
+            {
+                "title": title,
+                "url": url,
+                "snippet": snippet,
+                "rank": len(results) + 1,
+            }
+        )
+
+    return results
+
+
 def extract_results_from_bing_rss(rss_text, max_count):
     if not rss_text:
         return []
@@ -263,25 +465,24 @@ def _attrs_to_text(tag):
 
 
 def _looks_like_noise(tag):
-    attrs_text = _attrs_to_text(tag)
-    return any(hint in attrs_text for hint in NOISE_HINTS)
+    return NOISE_HINT_PATTERN.search(_attrs_to_text(tag)) is not None
 
 
 def _prune_noise(container):
-    for tag in list(container.find_all(list(NOISE_TAGS))):
-        tag.decompose()
-
-    for tag in list(container.find_all(True)):
+    # One walk in document order: a removed tag's descendants come next and have no attrs left.
+    for tag in container.find_all(True):
         if not hasattr(tag, "attrs") or tag.attrs is None:
             continue
-        if _looks_like_noise(tag):
+        if tag.name in NOISE_TAGS or _looks_like_noise(tag):
             tag.decompose()
 
 
 def _clean_text(text):
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
-    cleaned = cleaned.replace("Â", " ").replace("â", "'").replace("â", "-")
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = WHITESPACE_PATTERN.sub(" ", (text or "")).strip()
+    # Most text has no mojibake; only then is a second whitespace pass needed.
+    if "\u00c2" in cleaned or "\u00e2" in cleaned:
+        cleaned = MOJIBAKE_PATTERN.sub(lambda match: MOJIBAKE_REPLACEMENTS[match.group()], cleaned)
+        cleaned = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
     return cleaned
 
 
@@ -304,7 +505,7 @@ def _extract_with_readability(html_text):
     try:
         doc = Document(html_text)
         summary_html = doc.summary(html_partial=True)
-        summary_soup = BeautifulSoup(summary_html, "html.parser")
+        summary_soup = BeautifulSoup(summary_html, HTML_PARSER)
         _prune_noise(summary_soup)
         paragraph_text = _extract_paragraph_text(summary_soup)
         if paragraph_text:
@@ -315,6 +516,18 @@ def _extract_with_readability(html_text):
         return ""
 
 
+def _word_counts(soup):
+    # Reverse document order visits children before their parent, so each tag sums its
+    # children once instead of re-reading all nested text through get_text().
+    counts = {}
+    for node in reversed(list(soup.descendants)):
+        if isinstance(node, Tag):
+            counts[id(node)] = sum(counts.get(id(child), 0) for child in node.children)
+        elif type(node) in WORD_COUNT_STRING_TYPES:
+            counts[id(node)] = len(node.split())
+    return counts
+
+
 def _pick_content_container(soup):
     preferred_selectors = ["article", "main", "[role='main']"]
     for selector in preferred_selectors:
@@ -324,16 +537,19 @@ def _pick_content_container(soup):
             if preview_words >= 60:
                 return candidate
 
+    word_counts = None
     best_tag = None
     best_words = 0
     for tag in soup.find_all(["section", "div", "main", "article"]):
         attrs_text = _attrs_to_text(tag)
-        if not any(hint in attrs_text for hint in CONTENT_HINTS):
+        if CONTENT_HINT_PATTERN.search(attrs_text) is None:
             continue
-        if any(hint in attrs_text for hint in NOISE_HINTS):
+        if NOISE_HINT_PATTERN.search(attrs_text) is not None:
             continue
 
-        word_count = len(tag.get_text(" ", strip=True).split())
+        if word_counts is None:
+            word_counts = _word_counts(soup)
+        word_count = word_counts[id(tag)]
         if word_count > best_words:
             best_words = word_count
             best_tag = tag
@@ -349,18 +565,19 @@ def extract_readable_text(html_text):
     if len(readability_text.split()) >= 80:
         return readability_text
 
-    soup = BeautifulSoup(html_text, "html.parser")
+    soup = BeautifulSoup(html_text, HTML_PARSER)
     content_root = _pick_content_container(soup)
     _prune_noise(content_root)
 
     paragraph_text = _extract_paragraph_text(content_root)
     text = paragraph_text if paragraph_text else _clean_text(content_root.get_text(separator=" ", strip=True))
 
-    if len(text.split()) < 60:
-        fallback_soup = BeautifulSoup(html_text, "html.parser")
-        _prune_noise(fallback_soup)
-        paragraph_text = _extract_paragraph_text(fallback_soup)
-        text = paragraph_text if paragraph_text else _clean_text(fallback_soup.get_text(separator=" ", strip=True))
+    if len(text.split()) < 60 and content_root is not soup:
+        # Pruning depends only on each tag and its ancestors, so pruning the rest of the
+        # same soup gives the tree a fresh parse + prune would, without parsing again.
+        _prune_noise(soup)
+        paragraph_text = _extract_paragraph_text(soup)
+        text = paragraph_text if paragraph_text else _clean_text(soup.get_text(separator=" ", strip=True))
 
     if len(text.split()) < 40 and readability_text:
         text = readability_text
@@ -377,12 +594,12 @@ def summarize_words(text, target_words):
     return " ".join(words[:target_words])
 
 
-def summarize_linked_page(url, timeout_seconds, target_words):
+def summarize_linked_page(url, timeout_seconds, target_words, max_age_seconds=0):
     parsed = urllib.parse.urlparse(url)
     if parsed.scheme not in ("http", "https"):
         return "", 0, "skipped: unsupported scheme"
 
-    html_text, content_type, final_url = fetch_url_text(url, timeout_seconds)
+    html_text, content_type, final_url = fetch_url_text(url, timeout_seconds, max_age_seconds)
     if content_type and "html" not in content_type:
         return "", 0, f"skipped: non-html ({content_type})"
 
@@ -396,29 +613,39 @@ def summarize_linked_page(url, timeout_seconds, target_words):
     return summary, word_count, f"ok ({final_url})"
 
 
-def enrich_results_with_page_text(results, page_timeout, words_per_page):
-    enriched = []
-    for result in results:
-        entry = dict(result)
-        url = entry.get("url", "")
+def enrich_result_with_page_text(result, page_timeout, words_per_page, max_age_seconds=0):
+    entry = dict(result)
+    url = entry.get("url", "")
 
-        try:
-            summary, word_count, status = summarize_linked_page(url, page_timeout, words_per_page)
-            entry["page_summary"] = summary
-            entry["page_words"] = word_count
-            entry["page_status"] = status
-        except Exception as e:
-            entry["page_summary"] = ""
-            entry["page_words"] = 0
-            entry["page_status"] = f"error: {str(e)}"
+    try:
+        summary, word_count, status = summarize_linked_page(url, page_timeout, words_per_page, max_age_seconds)
+        entry["page_summary"] = summary
+        entry["page_words"] = word_count
+        entry["page_status"] = status
+    except Exception as e:
+        entry["page_summary"] = ""
+        entry["page_words"] = 0
+        entry["page_status"] = f"error: {str(e)}"
 
-        enriched.append(entry)
+    return entry
 
-    return enriched
+
+def enrich_results_with_page_text(results, page_timeout, words_per_page, max_age_seconds=0):
+    if not results:
+        return []
+
+    # map() keeps result order, so ranks and the log layout are unchanged.
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(results))) as executor:
+        return list(
+            executor.map(
+                lambda result: enrich_result_with_page_text(result, page_timeout, words_per_page, max_age_seconds),
+                results,
+            )
+        )
 
 
 def query_to_filename(query):
-    tokens = re.findall(r"[A-Za-z0-9]+", query or "")
+    tokens = QUERY_TOKEN_PATTERN.findall(query or "")
     if not tokens:
         return "Search"
 
@@ -433,7 +660,7 @@ def query_to_filename(query):
 
 
 def _normalize_query_spacing(text):
-    return re.sub(r"\s+", " ", (text or "").strip())
+    return WHITESPACE_PATTERN.sub(" ", (text or "").strip())
 
 
 def build_relaxed_queries(query):
@@ -442,16 +669,16 @@ def build_relaxed_queries(query):
     if not base:
         return candidates
 
-    no_latest = _normalize_query_spacing(re.sub(r"\blatest\b", "", base, flags=re.IGNORECASE))
+    no_latest = _normalize_query_spacing(LATEST_PATTERN.sub("", base))
     if no_latest and no_latest.lower() != base.lower():
         candidates.append(no_latest)
 
-    award_singular = _normalize_query_spacing(re.sub(r"\bawards\b", "award", base, flags=re.IGNORECASE))
+    award_singular = _normalize_query_spacing(AWARDS_PATTERN.sub("award", base))
     if award_singular and award_singular.lower() != base.lower():
         candidates.append(award_singular)
 
     no_latest_award_singular = _normalize_query_spacing(
-        re.sub(r"\bawards\b", "award", no_latest, flags=re.IGNORECASE)
+        AWARDS_PATTERN.sub("award", no_latest)
     )
     if no_latest_award_singular and no_latest_award_singular.lower() not in {base.lower(), no_latest.lower(), award_singular.lower()}:
         candidates.append(no_latest_award_singular)
@@ -459,6 +686,51 @@ def build_relaxed_queries(query):
     return candidates
 
 
+def run_search_attempt(engine, query, max_results, timeout_seconds, cancel_event=None, earlier_attempts=()):
+    if engine == "bing":
+        rss_text = fetch_bing_news_rss(query, timeout_seconds, cancel_event, earlier_attempts)
+        return extract_results_from_bing_rss(rss_text, max_results)
+    search_html = fetch_duckduckgo_html(query, timeout_seconds, cancel_event)
+    return extract_results_from_html(search_html, max_results)
+
+
+def search_with_fallbacks(query, max_results, timeout_seconds):
+    # Fallback order: DuckDuckGo then Bing News for the query, then for each relaxed query.
+    attempts = [("duckduckgo", query, "duckduckgo_html"), ("bing", query, "bing_news_rss")]
+    for relaxed_query in build_relaxed_queries(query):
+        attempts.append(("duckduckgo", relaxed_query, "duckduckgo_html_relaxed"))
+        attempts.append(("bing", relaxed_query, "bing_news_rss_relaxed"))
+
+    # All attempts start at once (per-host pacing still spaces requests to the same engine);
+    # once an answer is settled, attempts still waiting for a slot are cancelled.
+    cancel_event = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS)
+    try:
+        futures = []
+        for engine, attempt_query, _ in attempts:
+            earlier_attempts = tuple(futures) if engine == "bing" else ()
+            future = executor.submit(
+                run_search_attempt, engine, attempt_query, max_results, timeout_seconds, cancel_event, earlier_attempts
+            )
+            futures.append(future)
+        # Settled in fallback order, so the chosen source never depends on which reply lands first.
+        for index, future in enumerate(futures):
+            try:
+                results = future.result()
+            except Exception:
+                # Only a failed primary DuckDuckGo search is fatal, as before.
+                if index == 0:
+                    raise
+                continue
+            if results:
+                _, attempt_query, source = attempts[index]
+                return results, attempt_query, source
+        return [], query, "duckduckgo_html"
+    finally:
+        cancel_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def write_search_plus_log(navigator, domain, query, results, words_per_page):
     now = dt.datetime.now()
     timestamp = now.isoformat(timespec="seconds")
@@ -467,37 +739,42 @@ def write_search_plus_log(navigator, domain, query, results, words_per_page):
     log_dir = navigator.get_today_path(area="mine", domain=domain, create=True)
     log_file = log_dir / f"{filename}.txt"
 
-    with log_file.open("a", encoding="utf-8") as handle:
-        handle.write(f"Domain: {domain}\n")
-        handle.write(f"Query: {query}\n")
-        handle.write(f"Timestamp: {timestamp}\n")
-        handle.write(f"PerPageSummaryWords: {words_per_page}\n")
+    lines = [
+        f"Domain: {domain}\n",
+        f"Query: {query}\n",
+        f"Timestamp: {timestamp}\n",
+        f"PerPageSummaryWords: {words_per_page}\n",
+    ]
+
+    for item in results:
+        title = (item.get("title") or "").strip()
+        url = (item.get("url") or "").strip()
+        snippet = (item.get("snippet") or "").strip()
+        page_summary = (item.get("page_summary") or "").strip()
+        page_words = item.get("page_words", 0)
+        page_status = (item.get("page_status") or "").strip()
 
-        for item in results:
-            title = (item.get("title") or "").strip()
-            url = (item.get("url") or "").strip()
-            snippet = (item.get("snippet") or "").strip()
-            page_summary = (item.get("page_summary") or "").strip()
-            page_words = item.get("page_words", 0)
-            page_status = (item.get("page_status") or "").strip()
+        if title:
+            lines.append(f"- {title}\n")
+        if url:
+            lines.append(f"  {url}\n")
+        if snippet:
+            lines.append(f"  {snippet}\n")
 
-            if title:
-                handle.write(f"- {title}\n")
-            if url:
-                handle.write(f"  {url}\n")
-            if snippet:
-                handle.write(f"  {snippet}\n")
+        lines.append(f"  LinkedPageStatus: {page_status}\n")
+        lines.append(f"  LinkedPageSummaryWords: {page_words}\n")
 
-            handle.write(f"  LinkedPageStatus: {page_status}\n")
-            handle.write(f"  LinkedPageSummaryWords: {page_words}\n")
+        if page_summary:
+            lines.append("  LinkedPageSummary:\n")
+            lines.append(f"  {page_summary}\n")
 
-            if page_summary:
-                handle.write("  LinkedPageSummary:\n")
-                handle.write(f"  {page_summary}\n")
+        lines.append("\n")
 
-            handle.write("\n")
+    lines.append("\n")
 
-        handle.write("\n")
+    # One write of the whole entry keeps it contiguous when appending.
+    with log_file.open("a", encoding="utf-8", buffering=1 << 16) as handle:
+        handle.write("".join(lines))
 
     return str(log_file)
 
@@ -513,6 +790,12 @@ def main():
     parser.add_argument("--page-timeout", type=int, default=15, help="Page timeout seconds (5-60)")
     parser.add_argument("--words", type=int, default=200, help="Target words per linked page summary (80-400)")
     parser.add_argument("--sleep-ms", type=int, default=0, help="Optional sleep before search in milliseconds")
+    parser.add_argument(
+        "--max-age",
+        type=int,
+        default=PAGE_CACHE_MAX_AGE_SECONDS,
+        help="Reuse cached linked pages fetched within this many seconds (0 disables the cache)",
+    )
 
     try:
         args = parser.parse_args()
@@ -550,44 +833,11 @@ def main():
     navigator = FolderNavigator.from_fixed_point()
 
     try:
-        effective_query = query
-        search_html = fetch_duckduckgo_html(effective_query, timeout_seconds)
-        base_results = extract_results_from_html(search_html, max_results)
-        result_source = "duckduckgo_html"
+        base_results, effective_query, result_source = search_with_fallbacks(query, max_results, timeout_seconds)
 
-        if not base_results:
-            try:
-                rss_text = fetch_bing_news_rss(effective_query, timeout_seconds)
-                base_results = extract_results_from_bing_rss(rss_text, max_results)
-                if base_results:
-                    result_source = "bing_news_rss"
-            except Exception:
-                pass
-
-        if not base_results:
-            for relaxed_query in build_relaxed_queries(query):
-                try:
-                    search_html = fetch_duckduckgo_html(relaxed_query, timeout_seconds)
-                    base_results = extract_results_from_html(search_html, max_results)
-                    if base_results:
-                        effective_query = relaxed_query
-                        result_source = "duckduckgo_html_relaxed"
-                        break
-                except Exception:
-                    pass
-
-                try:
-                    rss_text = fetch_bing_news_rss(relaxed_query, timeout_seconds)
-                    base_results = extract_results_from_bing_rss(rss_text, max_results)
-                    if base_results:
-                        effective_query = relaxed_query
-                        result_source = "bing_news_rss_relaxed"
-                        break
-                except Exception:
-                    pass
-
-        enriched_results = enrich_results_with_page_text(base_results, page_timeout, words_per_page)
+        enriched_results = enrich_results_with_page_text(base_results, page_timeout, words_per_page, max(0, args.max_age))
         log_path = write_search_plus_log(navigator, domain, query, enriched_results, words_per_page)
+        prune_page_cache()
 
         response = {
             "domain": domain,
@@ -3,9 +3,12 @@
 
 import argparse
 import datetime as dt
+import hashlib
 import json
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
@@ -17,7 +20,9 @@ from CommonCode.FolderNavigator import FolderNavigator
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print(
         json.dumps(
@@ -39,10 +44,39 @@ try:
 except ImportError:
     Document = None
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 }
 
+HTTP_POOL_SIZE = 25
+MAX_FETCH_WORKERS = 10
+
+CACHE_ROOT = Path(__file__).resolve().parents[3] / "cache" / "Gen2WebText"
+NEGATIVE_CACHE_TTL_SECONDS = 600
+CACHE_MAX_PAGES = 512
+
+
+def build_session():
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=2, read=0, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
 NOISE_TAGS = {
     "script", "style", "noscript", "meta", "link", "nav", "header", "footer",
     "aside", "form", "button", "svg", "picture", "iframe"
@@ -71,6 +105,11 @@ SECTION_PATH_HINTS = {
     "/", "/news", "/sport", "/weather", "/iplayer", "/sounds", "/food", "/travel", "/culture"
 }
 
+PREFERRED_CONTAINER_SELECTORS = ("article", "main", "[role='main']")
+NOISE_TAG_FILTER = SoupStrainer(sorted(NOISE_TAGS))
+CONTAINER_TAG_FILTER = SoupStrainer(["section", "div", "main", "article"])
+ANCHOR_FILTER = SoupStrainer("a", href=True)
+
 
 def validate_domain(domain):
     if not domain or not isinstance(domain, str):
@@ -90,21 +129,126 @@ def validate_url(url):
     return url
 
 
-def fetch_html(url, timeout_seconds):
-    response = requests.get(
+def _cache_path(url, suffix):
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return CACHE_ROOT / f"{digest}{suffix}"
+
+
+def load_cached_page(url):
+    meta_path, html_path = _cache_path(url, ".json"), _cache_path(url, ".html")
+    try:
+        page = json.loads(meta_path.read_text(encoding="utf-8"))
+        page["html"] = html_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(page.get("parsed"), dict):
+        page["parsed"] = {}
+    return page
+
+
+def store_cached_page(page):
+    if not (page.get("etag") or page.get("last_modified")):
+        return
+
+    meta_path, html_path = _cache_path(page["url"], ".json"), _cache_path(page["url"], ".html")
+    meta = {key: value for key, value in page.items() if key != "html"}
+    try:
+        CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        html_path.write_bytes(page["html"])
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def load_cached_failure(url):
+    path = _cache_path(url, ".fail")
+    try:
+        if time.time() - path.stat().st_mtime >= NEGATIVE_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding="utf-8").strip() or "unknown"
+    except OSError:
+        return None
+
+
+def store_cached_failure(url, reason):
+    try:
+        CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        _cache_path(url, ".fail").write_text(reason, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def prune_cache(max_pages=CACHE_MAX_PAGES):
+    try:
+        cache_files = list(CACHE_ROOT.iterdir())
+    except OSError:
+        return
+
+    now = time.time()
+    pages = []
+    stale = []
+    for path in cache_files:
+        try:
+            modified = path.stat().st_mtime
+        except OSError:
+            continue
+        if path.suffix == ".json":
+            pages.append((modified, path))
+        elif path.suffix == ".fail" and now - modified >= NEGATIVE_CACHE_TTL_SECONDS:
+            stale.append(path)
+
+    pages.sort(reverse=True)
+    for _, meta_path in pages[max_pages:]:
+        stale.extend([meta_path, meta_path.with_suffix(".html")])
+
+    for path in stale:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def fetch_page(url, timeout_seconds):
+    failure = load_cached_failure(url)
+    if failure:
+        raise ValueError(f"{failure} (cached failure)")
+
+    cached = load_cached_page(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = SESSION.get(
         url,
-        headers=HEADERS,
+        headers=headers,
         timeout=timeout_seconds,
         allow_redirects=True,
         verify=True,
     )
+    if cached and response.status_code == 304:
+        return cached
+
+    if response.status_code >= 400:
+        store_cached_failure(url, f"HTTP {response.status_code}")
     response.raise_for_status()
 
     content_type = response.headers.get("content-type", "").lower()
     if "text/html" not in content_type:
-        raise ValueError(f"Unsupported content type: {response.headers.get('content-type', 'unknown')}")
+        reason = f"Unsupported content type: {response.headers.get('content-type', 'unknown')}"
+        store_cached_failure(url, reason)
+        raise ValueError(reason)
 
-    return response.text, response.url
+    return {
+        "url": url,
+        "resolved_url": response.url,
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "html": response.content,
+        "parsed": {},
+    }
 
 
 def _attrs_to_text(tag):
@@ -141,7 +285,7 @@ def _looks_like_noise(tag):
 
 
 def _prune_noise(container):
-    for tag in list(container.find_all(list(NOISE_TAGS))):
+    for tag in list(container.find_all(NOISE_TAG_FILTER)):
         tag.decompose()
 
     for tag in list(container.find_all(True)):
@@ -177,7 +321,7 @@ def _extract_with_readability(html):
     try:
         doc = Document(html)
         summary_html = doc.summary(html_partial=True)
-        summary_soup = BeautifulSoup(summary_html, "html.parser")
+        summary_soup = BeautifulSoup(summary_html, HTML_PARSER)
         _prune_noise(summary_soup)
         paragraph_text = _extract_paragraph_text(summary_soup)
         if paragraph_text:
@@ -189,8 +333,7 @@ def _extract_with_readability(html):
 
 
 def _pick_content_container(soup):
-    preferred_selectors = ["article", "main", "[role='main']"]
-    for selector in preferred_selectors:
+    for selector in PREFERRED_CONTAINER_SELECTORS:
         candidate = soup.select_one(selector)
         if candidate:
             preview_words = len(candidate.get_text(" ", strip=True).split())
@@ -199,7 +342,7 @@ def _pick_content_container(soup):
 
     best_tag = None
     best_words = 0
-    for tag in soup.find_all(["section", "div", "main", "article"]):
+    for tag in soup.find_all(CONTAINER_TAG_FILTER):
         attrs_text = _attrs_to_text(tag)
         if not any(hint in attrs_text for hint in CONTENT_HINTS):
             continue
@@ -217,12 +360,13 @@ def _pick_content_container(soup):
     return soup
 
 
-def extract_readable_text(html):
+def extract_readable_text(html, soup=None):
     readability_text = _extract_with_readability(html)
     if len(readability_text.split()) >= 80:
         return readability_text
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
     content_root = _pick_content_container(soup)
     _prune_noise(content_root)
 
@@ -230,7 +374,7 @@ def extract_readable_text(html):
     text = paragraph_text if paragraph_text else _clean_text(content_root.get_text(separator=" ", strip=True))
 
     if len(text.split()) < 60:
-        fallback_soup = BeautifulSoup(html, "html.parser")
+        fallback_soup = BeautifulSoup(html, HTML_PARSER)
         _prune_noise(fallback_soup)
         paragraph_text = _extract_paragraph_text(fallback_soup)
         text = paragraph_text if paragraph_text else _clean_text(fallback_soup.get_text(separator=" ", strip=True))
@@ -292,14 +436,15 @@ def _link_score(start_host, normalized_url, anchor_text):
     return score
 
 
-def extract_links(start_url, html, max_links):
-    soup = BeautifulSoup(html, "html.parser")
+def extract_links(start_url, html, max_links, soup=None):
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
     content_root = _pick_content_container(soup)
     links = []
     seen = set()
     start_host = urlparse(start_url).netloc.lower()
 
-    for index, anchor in enumerate(content_root.find_all("a", href=True)):
+    for index, anchor in enumerate(content_root.find_all(ANCHOR_FILTER)):
         href = (anchor.get("href") or "").strip()
         anchor_text = " ".join((anchor.get_text(" ", strip=True) or "").split())
 
@@ -337,6 +482,30 @@ def extract_links(start_url, html, max_links):
     return selected
 
 
+def page_text(page):
+    text = page["parsed"].get("text")
+    if text is None:
+        text = extract_readable_text(page["html"])
+        page["parsed"]["text"] = text
+    return text
+
+
+def page_text_and_links(page, max_links):
+    parsed = page["parsed"]
+    key = f"links_{max_links}"
+    if "text" in parsed and key in parsed:
+        return parsed["text"], parsed[key]
+
+    # One tree serves both passes: links are read first because text
+    # extraction prunes noise from the tree in place.
+    soup = BeautifulSoup(page["html"], HTML_PARSER)
+    if key not in parsed:
+        parsed[key] = extract_links(page["resolved_url"], page["html"], max_links, soup=soup)
+    if "text" not in parsed:
+        parsed["text"] = extract_readable_text(page["html"], soup=soup)
+    return parsed["text"], parsed[key]
+
+
 def url_to_filename(url):
     try:
         parsed = urlparse(url)
@@ -387,8 +556,10 @@ def process_link(link, timeout_seconds, words_per_page):
     anchor_text = link.get("anchor_text", "")
 
     try:
-        html, resolved_url = fetch_html(url, timeout_seconds)
-        text = extract_readable_text(html)
+        page = fetch_page(url, timeout_seconds)
+        resolved_url = page["resolved_url"]
+        text = page_text(page)
+        store_cached_page(page)
         summary = summarize_words(text, words_per_page)
         page_words = len(summary.split()) if summary else 0
         if not summary:
@@ -467,18 +638,20 @@ def main():
     navigator = FolderNavigator.from_fixed_point()
 
     try:
-        start_html, resolved_start_url = fetch_html(start_url, timeout_seconds)
-        start_text = extract_readable_text(start_html)
+        start_page = fetch_page(start_url, timeout_seconds)
+        resolved_start_url = start_page["resolved_url"]
+        start_text, links = page_text_and_links(start_page, max_links)
         start_summary = summarize_words(start_text, words_per_page)
         start_words = len(start_summary.split()) if start_summary else 0
-
-        links = extract_links(resolved_start_url, start_html, max_links)
+        store_cached_page(start_page)
 
         results = []
-        for index, link in enumerate(links, start=1):
-            entry = process_link(link, timeout_seconds, words_per_page)
-            entry["rank"] = index
-            results.append(entry)
+        if links:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(links))) as executor:
+                entries = executor.map(lambda link: process_link(link, timeout_seconds, words_per_page), links)
+                for index, entry in enumerate(entries, start=1):
+                    entry["rank"] = index
+                    results.append(entry)
 
         log_path = write_log(
             navigator=navigator,
@@ -489,6 +662,7 @@ def main():
             results=results,
             words_per_page=words_per_page,
         )
+        prune_cache()
 
         response = {
             "domain": domain,